@@ -4,7 +4,7 @@
 """Configuration management for the resume customizer application."""
 
 import functools
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import Field, field_validator, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -141,19 +141,24 @@ class Settings(BaseSettings):
         return v
 
 
-@functools.lru_cache()
-def get_settings() -> Settings:
+def _build_settings(overrides: dict) -> Settings:
     """
-    Get cached settings instance.
+    Build a settings instance from field-name overrides.
+    
+    Args:
+        overrides: Field values that take precedence over the environment
     
     Returns:
-        Settings: Cached settings instance
-        
-    Note:
-        Use get_settings.cache_clear() to clear the cache if needed.
+        Settings: New settings instance
     """
+    # Fields are populated by alias (their environment variable names), and
+    # unknown keywords are ignored, so map field names onto their aliases
+    overrides = {
+        getattr(Settings.model_fields.get(name), 'alias', None) or name: value
+        for name, value in overrides.items()
+    }
     try:
-        return Settings()
+        return Settings(**overrides)
     except ValidationError as e:
         # Re-raise with custom message for specific validations
         for error in e.errors():
@@ -161,4 +166,36 @@ def get_settings() -> Settings:
                 raise ValueError("API key is required") from e
             elif error['loc'] == ('RESUME_OUTPUT_FORMAT',) and error['type'] == 'literal_error':
                 raise ValueError("output_format must be one of ['markdown', 'html', 'pdf']") from e
-        raise
\ No newline at end of file
+        raise
+
+
+@functools.lru_cache()
+def _cached_settings(items: tuple) -> Settings:
+    """Build and cache settings keyed on sorted (name, value) override pairs."""
+    return _build_settings(dict(items))
+
+
+def get_settings(**overrides: Any) -> Settings:
+    """
+    Get cached settings instance.
+    
+    Args:
+        **overrides: Field values that take precedence over the environment;
+            each distinct set of overrides is cached separately, regardless
+            of keyword order. Overrides with unhashable values are not cached.
+    
+    Returns:
+        Settings: Cached settings instance
+        
+    Note:
+        Use get_settings.cache_clear() to clear the cache if needed.
+    """
+    key = tuple(sorted(overrides.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return _build_settings(overrides)
+    return _cached_settings(key)
+
+
+get_settings.cache_clear = _cached_settings.cache_clear
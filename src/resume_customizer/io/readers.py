@@ -3,11 +3,53 @@
 
 """Readers for various resume file formats."""
 
+import codecs
+import copy
+import functools
 import chardet
 import yaml
 import re
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import BinaryIO, Dict, Optional, Any, Union
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Byte sample sizes used for encoding detection. chardet converges quickly,
+# so a small prefix is usually enough; a larger one is tried when unsure.
+ENCODING_SAMPLE_SIZE = 8192
+ENCODING_RETRY_SAMPLE_SIZE = 65536
+
+# Front matter must close within this many leading characters
+FRONT_MATTER_SCAN_LIMIT = 65536
+
+# Canonical name of the codec used when every other decode attempt fails
+_FALLBACK_ENCODING = codecs.lookup('latin-1').name
+
+# Byte order marks and the codecs they identify; the BOM is stripped and
+# the remainder decoded without running statistical detection
+_BOMS = {
+    b'\xef\xbb\xbf': 'utf-8',
+    b'\xff\xfe': 'utf-16-le',
+    b'\xfe\xff': 'utf-16-be',
+}
+
+# Headers for the sections every resume is expected to contain
+_REQUIRED_SECTIONS = frozenset({'experience', 'skills'})
+_REQUIRED_SECTIONS_RE = re.compile(
+    r'^#+\s*(experience|skills)', re.MULTILINE | re.IGNORECASE
+)
+
+# Any markdown header line
+_HEADER_RE = re.compile(r'^#+\s+.+$', re.MULTILINE)
+
+# Maximum number of entries kept by the read and content-parsing caches
+READ_CACHE_SIZE = 64
+CONTENT_CACHE_SIZE = 256
 
 
 class MarkdownReader:
@@ -15,18 +57,27 @@ class MarkdownReader:
     
     def __init__(self):
         """Initialize the MarkdownReader."""
-        self.supported_encodings = [
-            'utf-8', 'utf-16', 'utf-16-le', 'utf-16-be',
-            'latin-1', 'iso-8859-1', 'windows-1252',
-            'ascii'
-        ]
+        # Canonical codec names, so aliases (e.g. latin-1/iso-8859-1)
+        # are only attempted once
+        self.supported_encodings = list(dict.fromkeys(
+            codecs.lookup(enc).name for enc in [
+                'utf-8', 'utf-16', 'utf-16-le', 'utf-16-be',
+                'windows-1252', 'ascii', 'latin-1', 'iso-8859-1'
+            ]
+        ))
+        # Decoded file contents keyed by (resolved path, mtime_ns, size), so
+        # repeated reads of an unchanged file skip the disk and decoding work
+        self._read_cached = functools.lru_cache(maxsize=READ_CACHE_SIZE)(
+            self._read_file
+        )
     
-    def read(self, filepath: str) -> str:
+    def read(self, filepath: Union[str, BinaryIO]) -> str:
         """
         Read a markdown file with automatic encoding detection.
         
         Args:
-            filepath: Path to the markdown file
+            filepath: Path to the markdown file, or a binary stream to read
+                from (streams are decoded directly and never cached)
             
         Returns:
             The file contents as a string
@@ -34,14 +85,33 @@ class MarkdownReader:
         Raises:
             FileNotFoundError: If the file doesn't exist
             PermissionError: If the file can't be read due to permissions
-            UnicodeDecodeError: If the file encoding can't be determined
         """
+        if hasattr(filepath, 'read'):
+            return self._decode(filepath.read())
+        
         path = Path(filepath)
         
         # Check if file exists
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
+        stat = path.stat()
+        return self._read_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    def _read_file(self, filepath: str, mtime_ns: int, size: int) -> str:
+        """
+        Read and decode a file; the stat values only serve as cache keys.
+        
+        Args:
+            filepath: Resolved path to the markdown file
+            mtime_ns: Modification time of the file in nanoseconds
+            size: Size of the file in bytes
+            
+        Returns:
+            The file contents as a string
+        """
+        path = Path(filepath)
+        
         # Read file as bytes first for encoding detection
         try:
             with open(path, 'rb') as f:
@@ -49,46 +119,50 @@ class MarkdownReader:
         except PermissionError:
             raise PermissionError(f"Permission denied: {filepath}")
         
+        return self._decode(raw_content)
+    
+    def _decode(self, raw_content: bytes) -> str:
+        """
+        Decode raw file bytes, detecting the encoding.
+        
+        Args:
+            raw_content: Raw bytes from the file
+            
+        Returns:
+            The decoded contents as a string
+        """
         # Handle empty files
         if not raw_content:
             return ""
         
-        # Detect encoding
-        encoding = self._detect_encoding(raw_content)
-        
-        # Remove BOM if present
-        if raw_content.startswith(b'\xef\xbb\xbf'):  # UTF-8 BOM
-            raw_content = raw_content[3:]
-        elif raw_content.startswith(b'\xff\xfe'):  # UTF-16 LE BOM
-            raw_content = raw_content[2:]
-        elif raw_content.startswith(b'\xfe\xff'):  # UTF-16 BE BOM
-            raw_content = raw_content[2:]
+        # A BOM names the encoding outright
+        bom = raw_content[:3] if raw_content[:3] in _BOMS else raw_content[:2]
+        encoding = _BOMS.get(bom)
+        if encoding:
+            raw_content = raw_content[len(bom):]
+        else:
+            # Most resumes are UTF-8, and a strict decode rejects anything
+            # else, so only fall back to chardet when it fails
+            try:
+                return raw_content.decode('utf-8')
+            except UnicodeDecodeError:
+                encoding = self._detect_encoding(raw_content)
         
         # Try to decode with detected encoding
         try:
             content = raw_content.decode(encoding)
             return content
-        except UnicodeDecodeError as e:
+        except UnicodeDecodeError:
             # Try fallback encodings
             for enc in self.supported_encodings:
-                if enc != encoding:
+                if enc not in (encoding, _FALLBACK_ENCODING):
                     try:
                         return raw_content.decode(enc)
                     except UnicodeDecodeError:
                         continue
             
-            # Last resort: try with error handling
-            try:
-                return raw_content.decode('utf-8', errors='replace')
-            except:
-                # If all else fails, raise the original error
-                raise UnicodeDecodeError(
-                    encoding,
-                    raw_content,
-                    e.start,
-                    e.end,
-                    f"Unable to decode file with any supported encoding: {filepath}"
-                )
+            # Last resort: latin-1 maps every byte, so decoding cannot fail
+            return raw_content.decode(_FALLBACK_ENCODING)
     
     def _detect_encoding(self, raw_content: bytes) -> str:
         """
@@ -100,15 +174,23 @@ class MarkdownReader:
         Returns:
             Detected encoding name
         """
-        # Use chardet for encoding detection
-        detection = chardet.detect(raw_content)
+        # Use chardet on a leading sample rather than the whole file
+        detection = chardet.detect(raw_content[:ENCODING_SAMPLE_SIZE])
+        
+        # Retry with a larger sample if the first one was inconclusive
+        if (detection['confidence'] <= 0.7
+                and len(raw_content) > ENCODING_SAMPLE_SIZE):
+            detection = chardet.detect(raw_content[:ENCODING_RETRY_SAMPLE_SIZE])
         
         if detection['confidence'] > 0.7:
             encoding = detection['encoding']
             # Normalize encoding name
             if encoding:
-                encoding = encoding.lower()
-                if encoding in ['ascii', 'iso-8859-1']:
+                try:
+                    encoding = codecs.lookup(encoding).name
+                except LookupError:
+                    return 'utf-8'  # Unknown to Python's codec registry
+                if encoding in ('ascii', _FALLBACK_ENCODING):
                     return 'utf-8'  # Prefer UTF-8 for ASCII-compatible files
                 return encoding
         
@@ -125,15 +207,7 @@ class MarkdownReader:
         Returns:
             True if valid markdown structure, False otherwise
         """
-        if not content.strip():
-            return False
-        
-        # Check for at least one header
-        header_pattern = r'^#+\s+.+$'
-        if not re.search(header_pattern, content, re.MULTILINE):
-            return False
-        
-        return True
+        return _validate_structure(content)
     
     def extract_metadata(self, content: str) -> Dict[str, Any]:
         """
@@ -145,19 +219,8 @@ class MarkdownReader:
         Returns:
             Dictionary of metadata, empty dict if no metadata found
         """
-        # Check for YAML front matter
-        yaml_pattern = r'^---\s*\n(.*?)\n---\s*$'
-        match = re.match(yaml_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        if match:
-            yaml_content = match.group(1)
-            try:
-                metadata = yaml.safe_load(yaml_content)
-                return metadata if metadata else {}
-            except yaml.YAMLError:
-                return {}
-        
-        return {}
+        # Copy so callers can't mutate the cached result
+        return copy.deepcopy(_extract_metadata(content))
     
     def has_required_sections(self, content: str) -> bool:
         """
@@ -169,13 +232,71 @@ class MarkdownReader:
         Returns:
             True if all required sections are present
         """
-        required_sections = ['experience', 'skills']
-        content_lower = content.lower()
-        
-        for section in required_sections:
-            # Look for section headers
-            section_pattern = rf'^#+\s*{section}'
-            if not re.search(section_pattern, content_lower, re.MULTILINE | re.IGNORECASE):
-                return False
+        return _has_required_sections(content)
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Report hit/miss statistics for the reader caches.
         
-        return True
\ No newline at end of file
+        Returns:
+            Dictionary mapping each cache name to its functools CacheInfo
+        """
+        return {
+            'read': self._read_cached.cache_info(),
+            'validate_structure': _validate_structure.cache_info(),
+            'extract_metadata': _extract_metadata.cache_info(),
+            'has_required_sections': _has_required_sections.cache_info(),
+        }
+
+
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def _validate_structure(content: str) -> bool:
+    """Check for non-empty content with at least one markdown header."""
+    # isspace avoids copying the content the way strip() would
+    if not content or content.isspace():
+        return False
+    
+    # Check for at least one header
+    return _HEADER_RE.search(content) is not None
+
+
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def _extract_metadata(content: str) -> Dict[str, Any]:
+    """Parse YAML front matter; callers must not mutate the returned dict."""
+    # Front matter must open on the very first line with a bare '---'
+    if not content.startswith('---'):
+        return {}
+    start = content.find('\n') + 1
+    if start == 0 or content[3:start].strip():
+        return {}
+    
+    # Find the closing '---' line using plain string scans, bounded so a
+    # document that merely starts with '---' is not searched in full
+    end = content.find('\n---', start - 1, FRONT_MATTER_SCAN_LIMIT)
+    while end >= 0:
+        line_end = content.find('\n', end + 4)
+        if not content[end + 4:line_end if line_end >= 0 else len(content)].strip():
+            break
+        end = content.find('\n---', end + 4, FRONT_MATTER_SCAN_LIMIT)
+    if end < 0:
+        return {}
+    
+    yaml_content = content[start:end] if end >= start else ''
+    try:
+        metadata = yaml.load(yaml_content, Loader=_SafeLoader)
+        return metadata if metadata else {}
+    except yaml.YAMLError:
+        return {}
+
+
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def _has_required_sections(content: str) -> bool:
+    """Check that experience and skills section headers are present."""
+    # Single case-insensitive pass, stopping once every section is seen
+    found = set()
+    for match in _REQUIRED_SECTIONS_RE.finditer(content):
+        found.add(match.group(1).lower())
+        if found >= _REQUIRED_SECTIONS:
+            return True
+    
+    return False
\ No newline at end of file
@@ -3,17 +3,41 @@
 
 """Writers for saving customized resume files."""
 
+import codecs
+import functools
+import heapq
 import os
-import re
 import shutil
-import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from typing import Dict, Optional, Any, Sequence, Union
 
 from resume_customizer.models.result import CustomizationResult
 
 
+# Buffer size for binary output files
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Filename sanitization: unsafe characters and apostrophes are removed,
+# hyphens and parentheses become whitespace to be joined with underscores
+_FILENAME_TRANSLATION = str.maketrans(
+    {**{char: None for char in '<>:"/\\|?*\''}, **{char: ' ' for char in '-()'}}
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path(filepath: str, cwd: str) -> Path:
+    """
+    Expand and resolve an output path, memoized per working directory.
+    
+    The working directory is part of the cache key so relative paths stay
+    correct after a chdir; symlinks changed after the first call are not
+    picked up.
+    """
+    return (Path(cwd) / Path(filepath).expanduser()).resolve()
+
+
 class OutputWriter:
     """Writer for saving customized resume files with safety features."""
     
@@ -28,7 +52,8 @@ class OutputWriter:
         filepath: str,
         encoding: Optional[str] = None,
         atomic: bool = False,
-        max_backups: int = 5
+        max_backups: int = 5,
+        prefix: str = ""
     ) -> bool:
         """
         Write content to a file with safety checks.
@@ -39,6 +64,8 @@ class OutputWriter:
             encoding: File encoding (default: utf-8)
             atomic: Use atomic write (write to temp, then rename)
             max_backups: Maximum number of backups to keep
+            prefix: Text written ahead of the content, such as a metadata
+                header, without concatenating the two in memory
             
         Returns:
             True if successful, False otherwise
@@ -48,21 +75,37 @@ class OutputWriter:
             return False
         
         # Expand and resolve path
-        path = Path(filepath).expanduser().resolve()
+        path = _resolve_path(filepath, os.getcwd())
         
         try:
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create backup if file exists
+            encoding = encoding or self.default_encoding
+            # Incremental encoder so stateful codecs emit a single BOM
+            encoder = codecs.getincrementalencoder(encoding)()
+            parts = (encoder.encode(prefix), encoder.encode(content, final=True))
+            
+            # Create backup if file exists, unless it already holds this content
+            linked_backup = None
             if path.exists():
-                self._create_backup(path, max_backups)
+                if self._is_unchanged(parts, path):
+                    return True
+                # Atomic writes swap in a new inode, so a hardlink keeps the old data
+                linked_backup = self._create_backup(path, max_backups, link=atomic)
             
             # Write the file
             if atomic:
-                self._atomic_write(content, path, encoding or self.default_encoding)
+                try:
+                    self._atomic_write(parts, path)
+                except BaseException:
+                    # The file was not replaced, so a linked backup still shares
+                    # its inode and a later in-place write would change it too
+                    if linked_backup is not None:
+                        linked_backup.unlink(missing_ok=True)
+                    raise
             else:
-                self._direct_write(content, path, encoding or self.default_encoding)
+                self._direct_write(parts, path)
             
             return True
             
@@ -106,10 +149,9 @@ class OutputWriter:
         metadata_lines.append("<!-- ================================================ -->")
         metadata_lines.append("")  # Empty line after metadata
         
-        # Prepend metadata to content
-        full_content = "\n".join(metadata_lines) + content
-        
-        return self.write(full_content, filepath, encoding)
+        # Pass metadata as a prefix so the content is never copied into a
+        # combined string
+        return self.write(content, filepath, encoding, prefix="\n".join(metadata_lines))
     
     def write_with_confirmation(
         self,
@@ -128,7 +170,7 @@ class OutputWriter:
         Returns:
             Dictionary with success status and details
         """
-        path = Path(filepath).expanduser().resolve()
+        path = _resolve_path(filepath, os.getcwd())
         
         success = self.write(content, filepath, encoding)
         
@@ -154,12 +196,10 @@ class OutputWriter:
         Returns:
             Safe filename string
         """
-        # Replace unsafe characters
-        safe_chars = re.sub(r'[<>:"/\\|?*]', '', title)
-        # Replace apostrophes without adding underscore
-        safe_chars = safe_chars.replace("'", "")
-        # Replace spaces and special chars with underscores
-        safe_chars = re.sub(r'[\s\-()]+', '_', safe_chars)
+        # Drop unsafe characters and turn separators into spaces
+        safe_chars = title.translate(_FILENAME_TRANSLATION)
+        # Collapse whitespace runs into single underscores
+        safe_chars = '_'.join(safe_chars.split())
         # Remove leading/trailing underscores
         safe_chars = safe_chars.strip('_')
         
@@ -185,26 +225,105 @@ class OutputWriter:
         
         return True
     
-    def _create_backup(self, path: Path, max_backups: int) -> None:
+    def _is_unchanged(self, parts: Sequence[bytes], path: Path) -> bool:
+        """
+        Check whether a file already contains exactly this content.
+        
+        Args:
+            parts: Encoded chunks about to be written, in order
+            path: Existing file path
+            
+        Returns:
+            True if the file bytes match the concatenated chunks
+        """
+        if path.stat().st_size != sum(len(part) for part in parts):
+            return False
+        
+        existing = memoryview(path.read_bytes())
+        offset = 0
+        for part in parts:
+            if existing[offset:offset + len(part)] != part:
+                return False
+            offset += len(part)
+        return True
+    
+    def _create_backup(
+        self, path: Path, max_backups: int, link: bool = False
+    ) -> Optional[Path]:
         """
         Create a backup of existing file.
         
         Args:
             path: Path to the file to backup
             max_backups: Maximum number of backups to keep
+            link: Hardlink the backup instead of copying it. Only safe when
+                the file is about to be replaced rather than rewritten in place.
+                
+        Returns:
+            The backup path if it was hardlinked, None otherwise
         """
         if not path.exists():
-            return
+            return None
         
         # Generate backup filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = path.parent / f"{path.name}{self.backup_extension}.{timestamp}"
         
-        # Copy file to backup
-        shutil.copy2(path, backup_path)
+        # Link or copy file to backup
+        linked = link and self._link_file(path, backup_path)
+        if not linked:
+            self._copy_file(path, backup_path)
         
         # Rotate old backups if needed
         self._rotate_backups(path, max_backups)
+        
+        return backup_path if linked else None
+    
+    def _link_file(self, source: Path, destination: Path) -> bool:
+        """
+        Hardlink a file, which takes constant time regardless of its size.
+        
+        Args:
+            source: File to link
+            destination: Path of the new link
+            
+        Returns:
+            True if the link was created, False if a copy is needed instead
+        """
+        try:
+            os.link(source, destination)
+        except OSError:
+            # e.g. cross-device, unsupported filesystem or existing destination
+            return False
+        return True
+    
+    def _copy_file(self, source: Path, destination: Path) -> None:
+        """
+        Copy file contents, letting the kernel do it in place where possible.
+        
+        Uses os.copy_file_range (a reflink on copy-on-write filesystems) and
+        falls back to shutil.copyfile where it is unavailable or unsupported.
+        File metadata is not copied; backups carry their own creation time.
+        
+        Args:
+            source: File to copy
+            destination: Path of the copy
+        """
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if copy_file_range is not None:
+            try:
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                return
+            except OSError:
+                pass  # e.g. cross-device copy or unsupported filesystem
+        
+        shutil.copyfile(source, destination)
     
     def _rotate_backups(self, path: Path, max_backups: int) -> None:
         """
@@ -214,53 +333,54 @@ class OutputWriter:
             path: Original file path
             max_backups: Maximum number of backups to keep
         """
-        # Find all backup files
-        backup_pattern = f"{path.name}{self.backup_extension}.*"
-        backup_files = sorted(path.parent.glob(backup_pattern))
+        # Find all backup files; timestamped names sort chronologically
+        prefix = f"{path.name}{self.backup_extension}."
+        with os.scandir(path.parent) as entries:
+            backup_names = [
+                entry.name for entry in entries if entry.name.startswith(prefix)
+            ]
         
         # Remove oldest backups if exceeding limit
-        while len(backup_files) > max_backups:
-            oldest = backup_files.pop(0)
-            oldest.unlink()
+        excess = len(backup_names) - max_backups
+        if excess > 0:
+            for name in heapq.nsmallest(excess, backup_names):
+                (path.parent / name).unlink()
     
-    def _direct_write(self, content: str, path: Path, encoding: str) -> None:
+    def _direct_write(self, parts: Sequence[bytes], path: Path) -> None:
         """
         Write content directly to file.
         
         Args:
-            content: Content to write
+            parts: Encoded chunks to write, in order
             path: File path
-            encoding: File encoding
         """
-        with open(path, 'w', encoding=encoding, newline='') as f:
-            f.write(content)
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for part in parts:
+                f.write(part)
     
-    def _atomic_write(self, content: str, path: Path, encoding: str) -> None:
+    def _atomic_write(self, parts: Sequence[bytes], path: Path) -> None:
         """
         Write content atomically using temp file.
         
         Args:
-            content: Content to write
+            parts: Encoded chunks to write, in order
             path: File path
-            encoding: File encoding
         """
-        # Write to temporary file in same directory
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding=encoding,
-            dir=path.parent,
-            delete=False,
-            newline=''
-        ) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            # Only fsync if we have a real file descriptor
-            if hasattr(tmp_file, 'fileno') and callable(tmp_file.fileno):
-                try:
-                    os.fsync(tmp_file.fileno())
-                except (TypeError, ValueError):
-                    pass  # Mock object or invalid file descriptor
-            tmp_path = tmp_file.name
-        
-        # Atomic rename
-        Path(tmp_path).replace(path)
\ No newline at end of file
+        # Write to a predictable temporary file in the same directory, unique
+        # per process and thread so concurrent writers never share one
+        tmp_path = path.with_name(
+            f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}"
+        )
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as tmp_file:
+                for part in parts:
+                    tmp_file.write(part)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            
+            # Atomic rename
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
\ No newline at end of file
@@ -3,13 +3,234 @@
 
 """Job description domain model for parsing and analyzing job postings."""
 
+import copy
+import functools
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Set, Tuple
 from resume_customizer.utils.logging import get_logger
 
 logger = get_logger("models.job_description")
 
+# Number of parsed job descriptions kept for repeated from_text calls
+PARSE_CACHE_SIZE = 256
+
+
+def _compile_sections(headers: List[str]) -> List["re.Pattern[str]"]:
+    """Compile section-header patterns that capture the bulleted body below."""
+    return [
+        re.compile(rf'{header}\s*\n((?:[-•*]\s*[^\n]+\n?)+)', re.IGNORECASE | re.MULTILINE)
+        for header in headers
+    ]
+
+
+def _find_section_bodies(patterns: List["re.Pattern[str]"], text: str) -> List[str]:
+    """
+    Return the bulleted bodies under each header, in header order.
+    
+    Each header is scanned separately so overlapping headers (such as
+    'Responsibilities:' inside 'Role Responsibilities:') all match.
+    
+    Args:
+        patterns: Patterns built by :func:`_compile_sections`
+        text: Job description text
+        
+    Returns:
+        Bulleted section bodies
+    """
+    return [body for pattern in patterns for body in pattern.findall(text)]
+
+
+def _find_first(text: str, needles: Tuple[str, ...]) -> int:
+    """Return the lowest index at which any needle occurs in text, or -1."""
+    return min((index for index in map(text.find, needles) if index >= 0), default=-1)
+
+
+# Patterns are compiled once at import time so parsing never pays for
+# pattern compilation or the re module's internal cache lookups.
+
+# Title and company extraction
+_TITLE_LABEL_RE = re.compile(r'^(?:Job Title|Position|Role|Title):\s*(.+)$', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+_HIRING_RE = re.compile(
+    r"(?:We're|We are)\s+(?:hiring|looking for|seeking)\s+(?:a|an)?\s*([^!.]+?)(?:\s+to\s+|\s+at\s+|!|\.|$)",
+    re.IGNORECASE
+)
+_JOIN_SUFFIX_RE = re.compile(r'\s+to\s+join.*$', re.IGNORECASE)
+_POSITION_RE = re.compile(
+    r'^(.+?)\s+(?:position|role|opportunity)\s*(?:available|open)?', re.IGNORECASE
+)
+_COMPANY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        r'^Company:\s*(.+?)$',
+        r'^Employer:\s*(.+?)$',
+        r'^Organization:\s*(.+?)$',
+        r'\bat\s+([A-Z][A-Za-z0-9\s&.-]+?)(?:\s*[!,.]|\s*$)',
+        r'\bfor\s+([A-Z][A-Za-z0-9\s&.-]+?)(?:\s*[!,.]|\s*$)',
+        r'(?:join|joining)\s+(?:our\s+)?(?:team\s+at\s+)?([A-Z][A-Za-z0-9\s&.-]+?)(?:[!,.]|$)',
+    )
+]
+_TRAILING_DASH_RE = re.compile(r'\s*[-–]\s*$')
+
+# Years of experience. The alternatives sit inside a lookahead so one scan
+# tests every position without one match hiding an overlapping one; numbers
+# must start at a digit-run boundary.
+_YEARS_RE = re.compile(
+    r'(?=' + '|'.join((
+        # Range patterns ("3-5 years"); the first value is the minimum
+        r'(?<!\d)(\d+)\s*(?:-|to)\s*\d+\s*years?\s*.*?(?:experience|expertise)',
+        # Standard patterns
+        r'(?<!\d)(\d+)\+?\s*(?:to\s*\d+\s*)?years?\s*(?:of\s*)?(?:experience|expertise)',
+        r'(?:minimum|at\s*least|requires?)\s*(\d+)\s*years?',
+        r'(?<!\d)(\d+)\s*years?\s*(?:minimum|required)',
+        r'(?<!\d)(\d+)\+?\s*years?\s+(?:of\s+)?[\w\s]+\s+experience',  # "5 years Python experience"
+    )) + r')',
+    re.IGNORECASE
+)
+
+# Section headers followed by bulleted lists
+_REQUIRED_SECTION_PATTERNS = _compile_sections([
+    r'Required\s*(?:Skills?|Qualifications?)?:?',
+    r'Requirements?:?',
+    r'Must\s*(?:Have|Haves?)?:?',
+    r'Essential\s*(?:Skills?|Qualifications?)?:?',
+    r'Mandatory\s*(?:Skills?|Requirements?)?:?',
+    r'Should\s*have:?',  # Sometimes "should have" is also required
+])
+_NICE_SECTION_PATTERNS = _compile_sections([
+    r'Nice\s*to\s*(?:Have|Haves?)?:?',
+    r'Preferred\s*(?:Skills?|Qualifications?)?:?',
+    r'Bonus\s*(?:Skills?|Points?)?:?',
+    r'(?:Would\s*be\s*)?(?:a\s*)?Plus:?',
+    r'Desirable\s*(?:Skills?)?:?',
+    r'(?:Good|Great)\s*to\s*Have:?',
+    r'Good\s*to\s*have:?',  # Handle case variations
+])
+_RESPONSIBILITY_SECTION_PATTERNS = _compile_sections([
+    r'Responsibilities?:?',
+    r'(?:Key\s+)?Duties:?',
+    r'What\s+you[\'\']?ll\s+do:?',
+    r'You\s+will:?',
+    r'Role\s+(?:Responsibilities?|Overview):?',
+])
+_QUALIFICATION_SECTION_PATTERNS = _compile_sections([
+    r'Qualifications?:?',
+    r'Education\s*(?:Requirements?)?:?',
+    r'(?:Minimum\s+)?Requirements?:?',
+    r'Required\s+Education:?',
+])
+
+# Inline mentions outside of bulleted sections
+_REQUIRED_INLINE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:strong|solid|extensive|expert)\s+(?:knowledge|experience|proficiency)\s+(?:in|with|of)\s+([A-Za-z0-9\s,/.-]+)',
+        r'(?:experience|proficiency|expertise)\s+(?:with|in)\s+([A-Za-z0-9\s,/.-]+)\s+(?:required|is\s+required)',
+    )
+]
+_NICE_INLINE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'([A-Za-z0-9\s,/.-]+?)\s+(?:would\s+be|is)\s+(?:a\s+)?(?:plus|bonus|advantage)',
+        r'(?:experience\s+with|knowledge\s+of)\s+([A-Za-z0-9\s,/.-]+?)\s+(?:is\s+)?(?:preferred|desired)',
+    )
+]
+_ACTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        r'(?:will\s+)?(?:be\s+)?(?:responsible\s+for|expected\s+to)\s+([^.]+)',
+        r'(?:Day\s+to\s+day|Daily),?\s*(?:you[\'\']?ll\s+)?(.+?)(?:\.|$)',
+    )
+]
+_DEGREE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'((?:Bachelor|Master|PhD|Doctoral)[\'\']?s?\s+(?:degree|Degree)\s+[^.]+)',
+        r'((?:BS|BA|MS|MA|MBA|PhD)\s+in\s+[^.]+)',
+    )
+]
+
+# Skill list parsing and normalization
+_BULLET_RE = re.compile(r'^[-•*]\s*', re.MULTILINE)
+_SKILL_DELIMITER_RE = re.compile(r'[,\n]')
+_SKILL_OR_RE = re.compile(r' or ', re.IGNORECASE)
+_SKILL_CONJUNCTION_RE = re.compile(r' (?:or|and) ', re.IGNORECASE)
+_PLAIN_WORDS_RE = re.compile(r'[A-Za-z ]*')
+_LANGUAGE_PREFIXES = tuple(
+    f'{lang} ' for lang in
+    ('python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust')
+)
+_SKILL_SUFFIXES = ('experience', 'knowledge', 'skills', 'skill', 'expertise', 'proficiency')
+
+# ATS keyword extraction. The term groups share no
+# words, so a single alternation finds the same terms as one scan per group.
+_TECHNICAL_TERMS = (
+    r'python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|php|swift|kotlin',
+    r'react|angular|vue|django|flask|spring|rails|express|fastapi',
+    r'sql|nosql|postgresql|mysql|mongodb|redis|elasticsearch',
+    r'aws|azure|gcp|cloud|serverless|lambda|kubernetes|docker',
+    r'api|rest|restful|graphql|grpc|websocket|microservices',
+    r'git|github|gitlab|bitbucket|ci/cd|jenkins|travis|circle',
+    r'agile|scrum|kanban|waterfall|lean|devops',
+    r'tdd|bdd|unit\s+test|integration\s+test|e2e|testing',
+    r'machine\s+learning|ml|ai|artificial\s+intelligence|deep\s+learning|nlp',
+    r'data\s+science|analytics|visualization|etl|data\s+pipeline',
+)
+_TECHNICAL_RE = re.compile(
+    r'\b(?:' + '|'.join(_TECHNICAL_TERMS) + r')\b', re.IGNORECASE
+)
+
+# Action verbs picked up anywhere inside responsibilities, substrings included.
+# No verb overlaps another, so alternation order does not matter.
+_ACTION_VERBS = frozenset({
+    'design', 'develop', 'implement', 'build', 'create', 'optimize',
+    'lead', 'manage', 'architect', 'deploy', 'maintain', 'analyze',
+})
+_ACTION_VERB_RE = re.compile('|'.join(sorted(_ACTION_VERBS)))
+
+# Filler words skipped when splitting multi-word skills into keywords
+_KEYWORD_STOPWORDS = frozenset({'and', 'the', 'for', 'with'})
+
+# Known all-caps terms
+_ALL_CAPS_SKILLS = frozenset({
+    'sql', 'html', 'css', 'xml', 'json', 'api', 'rest', 'aws', 'gcp', 'ci/cd', 'tdd', 'bdd'
+})
+
+# Known mixed-case terms, in precedence order for substring matches
+_MIXED_CASE_SKILLS = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript', 
+    'python': 'Python',
+    'java': 'Java',
+    'c#': 'C#',
+    'c++': 'C++',
+    'node.js': 'Node.js',
+    'vue.js': 'Vue.js',
+    'angular.js': 'Angular.js',
+    'postgresql': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'mongodb': 'MongoDB',
+    'graphql': 'GraphQL',
+    'django': 'Django',
+    'flask': 'Flask',
+    'react': 'React',
+    'react.js': 'React',
+    'kubernetes': 'Kubernetes',
+    'docker': 'Docker',
+    'git': 'Git',
+    'github': 'GitHub',
+    'gitlab': 'GitLab',
+    'linux': 'Linux',
+    'macos': 'macOS',
+    'redis': 'Redis',
+    'elasticsearch': 'Elasticsearch',
+    'machine learning': 'Machine Learning',
+    'aws certification': 'AWS',
+    'graphql knowledge': 'GraphQL',
+    'docker containerization': 'Docker',
+    'rest api development': 'REST API',
+    'linux/unix proficiency': 'Linux/Unix',
+    'ml background': 'ML',
+    'mobile development': 'Mobile Development',
+}
+
 
 @dataclass
 class JobDescription:
@@ -58,11 +279,16 @@ class JobDescription:
         if not text or not text.strip():
             raise ValueError("Empty or invalid job description")
         
+        # Identical postings are parsed once; callers get their own copy
+        return copy.deepcopy(_parse_cached(cls, text))
+    
+    @classmethod
+    def _parse(cls, text: str) -> "JobDescription":
+        """Parse a non-empty job description without consulting the cache."""
         logger.debug("Parsing job description from text")
         
         # Extract basic info
-        title = cls._extract_title(text)
-        company = cls._extract_company(text)
+        title, company = cls._extract_header(text)
         years_exp = cls._extract_years_of_experience(text)
         
         # Extract skills
@@ -90,54 +316,64 @@ class JobDescription:
         
         return job
     
+    @classmethod
+    def _extract_header(cls, text: str) -> Tuple[str, str]:
+        """
+        Extract job title and company from the top of the posting.
+        
+        Both only look at the first few lines, so those are split off and
+        stripped once instead of splitting the whole text for each.
+        
+        Args:
+            text: Job description text
+            
+        Returns:
+            Tuple of (title, company)
+        """
+        # Check first 10 lines
+        lines = [line.strip() for line in text.strip().split('\n', 10)[:10]]
+        return cls._extract_title(lines), cls._extract_company(lines, text)
+    
     @staticmethod
-    def _extract_title(text: str) -> str:
-        """Extract job title from text."""
-        lines = text.strip().split('\n')
-        
-        # Common patterns for job title
-        title_patterns = [
-            r'^Job Title:\s*(.+)$',
-            r'^Position:\s*(.+)$',
-            r'^Role:\s*(.+)$',
-            r'^Title:\s*(.+)$',
-        ]
-        
-        for i, line in enumerate(lines[:10]):  # Check first 10 lines
-            line = line.strip()
+    def _extract_title(lines: List[str]) -> str:
+        """Extract job title from the stripped header lines."""
+        # Explicit labels are the most reliable signal, so they win over
+        # any heuristic match on an earlier line
+        for line in lines:
+            match = _TITLE_LABEL_RE.match(line)
+            if match:
+                return match.group(1).strip()
+        
+        for line in lines:
             if not line:  # Skip empty lines
                 continue
-            
-            # Check explicit patterns
-            for pattern in title_patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    return match.group(1).strip()
+            line_lower = line.lower()
             
             # Check for "at/for Company" pattern
-            if ' at ' in line or ' for ' in line:
-                title = re.split(r'\s+(?:at|for)\s+', line)[0].strip()
-                if title and not any(char.isdigit() for char in title):
+            split_at = _find_first(line, (' at ', ' for '))
+            if split_at >= 0:
+                title = line[:split_at].strip()
+                if title and not _DIGIT_RE.search(title):
                     return title
             
             # Special case for "We're hiring [title]" pattern
-            hiring_match = re.search(r"(?:We're|We are)\s+(?:hiring|looking for|seeking)\s+(?:a|an)?\s*([^!.]+?)(?:\s+to\s+|\s+at\s+|!|\.|$)", line, re.IGNORECASE)
+            hiring_match = _HIRING_RE.search(line)
             if hiring_match:
                 title = hiring_match.group(1).strip()
                 # Clean up the title - remove trailing phrases
-                title = re.sub(r'\s+to\s+join.*$', '', title, flags=re.IGNORECASE)
+                title = _JOIN_SUFFIX_RE.sub('', title)
                 if title:
                     return title
             
             # First non-empty line that looks like a title
             if (line and len(line) < 100 and 
-                not any(word in line.lower() for word in ['about', 'location', 'description']) and
+                not any(word in line_lower for word in ['about', 'location', 'description']) and
                 not ':' in line):
                 # If it contains "we're hiring" etc, it's handled above
-                if any(phrase in line.lower() for phrase in ["we're hiring", "we are hiring", "looking for", "seeking"]):
+                if any(phrase in line_lower for phrase in ["we're hiring", "we are hiring", "looking for", "seeking"]):
                     continue
                 # Extract just the title part if it says "position available" etc
-                position_match = re.search(r'^(.+?)\s+(?:position|role|opportunity)\s*(?:available|open)?', line, re.IGNORECASE)
+                position_match = _POSITION_RE.search(line)
                 if position_match:
                     return position_match.group(1).strip()
                 # Likely a title if it's short and doesn't contain pronouns/common words
@@ -147,38 +383,28 @@ class JobDescription:
         return "Unknown"
     
     @staticmethod
-    def _extract_company(text: str) -> str:
-        """Extract company name from text."""
-        lines = text.strip().split('\n')
-        
-        # Patterns for company extraction
-        patterns = [
-            r'^Company:\s*(.+?)$',
-            r'^Employer:\s*(.+?)$',
-            r'^Organization:\s*(.+?)$',
-            r'\bat\s+([A-Z][A-Za-z0-9\s&.-]+?)(?:\s*[!,.]|\s*$)',
-            r'\bfor\s+([A-Z][A-Za-z0-9\s&.-]+?)(?:\s*[!,.]|\s*$)',
-            r'(?:join|joining)\s+(?:our\s+)?(?:team\s+at\s+)?([A-Z][A-Za-z0-9\s&.-]+?)(?:[!,.]|$)',
-        ]
-        
+    def _extract_company(lines: List[str], text: str) -> str:
+        """Extract company name from the stripped header lines, then the full text."""
         # First check if company is on second or third line (common pattern)
-        for i in range(1, min(4, len(lines))):
-            line = lines[i].strip()
-            if line and len(line) < 50 and not any(word in line.lower() for word in ['about', 'location', 'we', 'our']):
+        for line in lines[1:4]:
+            line_lower = line.lower()
+            if line and len(line) < 50 and not any(word in line_lower for word in ['about', 'location', 'we', 'our']):
                 # Could be company name if it's short and doesn't have common words
                 if not line.endswith('.') and ':' not in line and not ',' in line:
                     return line
         
         # Then check patterns
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 company = match.group(1).strip()
                 # Clean up company name
-                company = re.sub(r'\s*[-–]\s*$', '', company)
+                company = _TRAILING_DASH_RE.sub('', company)
                 company = company.strip('.,;!')
                 # Remove trailing "to join" type phrases
-                company = re.sub(r'\s+(?:to|who|that)\s+.*$', '', company)
+                clause_at = _find_first(company, (' to ', ' who ', ' that '))
+                if clause_at >= 0:
+                    company = company[:clause_at].rstrip()
                 return company
         
         return "Unknown"
@@ -186,120 +412,68 @@ class JobDescription:
     @staticmethod
     def _extract_years_of_experience(text: str) -> int:
         """Extract required years of experience."""
-        # Patterns for years of experience (order matters!)
-        patterns = [
-            # Range patterns first (more specific)
-            r'(\d+)\s*(?:-|to)\s*\d+\s*years?\s*.*?(?:experience|expertise)',
-            # Standard patterns
-            r'(\d+)\+?\s*(?:to\s*\d+\s*)?years?\s*(?:of\s*)?(?:experience|expertise)',
-            r'(?:minimum|at\s*least|requires?)\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*(?:minimum|required)',
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?[\w\s]+\s+experience',  # "5 years Python experience"
-        ]
-        
-        all_years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Extract years from matches
-                for match in matches:
-                    if isinstance(match, str):
-                        all_years.append(int(match))
-                    elif isinstance(match, tuple):
-                        # For range patterns like "3-5 years", take the first (minimum) value
-                        all_years.append(int(match[0]))
-        
         # Return the minimum years found (most lenient requirement)
-        return min(all_years) if all_years else 0
+        return min(
+            (int(years) for match in _YEARS_RE.finditer(text)
+             for years in match.groups() if years),
+            default=0
+        )
     
     @classmethod
     def _extract_required_skills(cls, text: str) -> List[str]:
         """Extract required skills from job description."""
         skills = []
         
-        # Define section headers for required skills
-        required_headers = [
-            r'Required\s*(?:Skills?|Qualifications?)?:?',
-            r'Requirements?:?',
-            r'Must\s*(?:Have|Haves?)?:?',
-            r'Essential\s*(?:Skills?|Qualifications?)?:?',
-            r'Mandatory\s*(?:Skills?|Requirements?)?:?',
-            r'Should\s*have:?',  # Sometimes "should have" is also required
-        ]
-        
         # Find required skills sections
-        for header_pattern in required_headers:
-            pattern = rf'{header_pattern}\s*\n((?:[-•*]\s*[^\n]+\n?)+)'
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                skills.extend(cls._parse_skill_list(match))
+        for match in _find_section_bodies(_REQUIRED_SECTION_PATTERNS, text):
+            skills.extend(cls._parse_skill_list(match))
         
         # Also look for inline requirements
-        inline_patterns = [
-            r'(?:strong|solid|extensive|expert)\s+(?:knowledge|experience|proficiency)\s+(?:in|with|of)\s+([A-Za-z0-9\s,/.-]+)',
-            r'(?:experience|proficiency|expertise)\s+(?:with|in)\s+([A-Za-z0-9\s,/.-]+)\s+(?:required|is\s+required)',
-        ]
-        
-        for pattern in inline_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skills.extend(cls._parse_skill_list(match))
+        for pattern in _REQUIRED_INLINE_PATTERNS:
+            for match in pattern.finditer(text):
+                skills.extend(cls._parse_skill_list(match.group(1)))
         
-        # Normalize and deduplicate
-        normalized_skills = []
-        seen = set()
-        for skill in skills:
-            normalized = cls._normalize_skill(skill)
-            if normalized and normalized.lower() not in seen:
-                seen.add(normalized.lower())
-                normalized_skills.append(normalized)
-        
-        return normalized_skills
+        return cls._dedupe_normalized(skills)
     
     @classmethod
     def _extract_nice_to_have_skills(cls, text: str) -> List[str]:
         """Extract nice-to-have skills from job description."""
         skills = []
         
-        # Define section headers for nice-to-have skills
-        nice_headers = [
-            r'Nice\s*to\s*(?:Have|Haves?)?:?',
-            r'Preferred\s*(?:Skills?|Qualifications?)?:?',
-            r'Bonus\s*(?:Skills?|Points?)?:?',
-            r'(?:Would\s*be\s*)?(?:a\s*)?Plus:?',
-            r'Desirable\s*(?:Skills?)?:?',
-            r'(?:Good|Great)\s*to\s*Have:?',
-            r'Good\s*to\s*have:?',  # Handle case variations
-        ]
-        
         # Find nice-to-have sections
-        for header_pattern in nice_headers:
-            pattern = rf'{header_pattern}\s*\n((?:[-•*]\s*[^\n]+\n?)+)'
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                skills.extend(cls._parse_skill_list(match))
+        for match in _find_section_bodies(_NICE_SECTION_PATTERNS, text):
+            skills.extend(cls._parse_skill_list(match))
         
         # Look for inline nice-to-have mentions
-        inline_patterns = [
-            r'([A-Za-z0-9\s,/.-]+?)\s+(?:would\s+be|is)\s+(?:a\s+)?(?:plus|bonus|advantage)',
-            r'(?:experience\s+with|knowledge\s+of)\s+([A-Za-z0-9\s,/.-]+?)\s+(?:is\s+)?(?:preferred|desired)',
-        ]
+        for pattern in _NICE_INLINE_PATTERNS:
+            for match in pattern.finditer(text):
+                skills.extend(cls._parse_skill_list(match.group(1)))
         
-        for pattern in inline_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skills.extend(cls._parse_skill_list(match))
+        return cls._dedupe_normalized(skills)
+    
+    @classmethod
+    def _dedupe_normalized(cls, skills: List[str]) -> List[str]:
+        """
+        Normalize skills and drop case-insensitive duplicates, keeping order.
         
-        # Normalize and deduplicate
+        Identical raw candidates are skipped before normalization, since
+        they would normalize to the same skill. Results are interned so that
+        equal skills share one string across parsed job descriptions.
+        """
         normalized_skills = []
         seen = set()
+        seen_raw = set()
         for skill in skills:
+            if skill in seen_raw:
+                continue
+            seen_raw.add(skill)
             normalized = cls._normalize_skill(skill)
-            if normalized and normalized.lower() not in seen:
-                seen.add(normalized.lower())
-                normalized_skills.append(normalized)
+            if not normalized:
+                continue
+            key = normalized.lower()
+            if key not in seen:
+                seen.add(key)
+                normalized_skills.append(sys.intern(normalized))
         
         return normalized_skills
     
@@ -308,39 +482,18 @@ class JobDescription:
         """Extract job responsibilities."""
         responsibilities = []
         
-        # Section headers for responsibilities
-        headers = [
-            r'Responsibilities?:?',
-            r'(?:Key\s+)?Duties:?',
-            r'What\s+you[\'\']?ll\s+do:?',
-            r'You\s+will:?',
-            r'Role\s+(?:Responsibilities?|Overview):?',
-        ]
-        
         # Find responsibility sections
-        for header_pattern in headers:
-            pattern = rf'{header_pattern}\s*\n((?:[-•*]\s*[^\n]+\n?)+)'
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                lines = match.strip().split('\n')
-                for line in lines:
-                    cleaned = re.sub(r'^[-•*]\s*', '', line).strip()
-                    if cleaned and len(cleaned) > 10:
-                        responsibilities.append(cleaned)
+        for match in _find_section_bodies(_RESPONSIBILITY_SECTION_PATTERNS, text):
+            lines = match.strip().split('\n')
+            for line in lines:
+                cleaned = _BULLET_RE.sub('', line).strip()
+                if cleaned and len(cleaned) > 10:
+                    responsibilities.append(cleaned)
         
         # Look for action verbs that indicate responsibilities
-        action_patterns = [
-            r'(?:will\s+)?(?:be\s+)?(?:responsible\s+for|expected\s+to)\s+([^.]+)',
-            r'(?:Day\s+to\s+day|Daily),?\s*(?:you[\'\']?ll\s+)?(.+?)(?:\.|$)',
-        ]
-        
-        for pattern in action_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                cleaned = match.strip()
+        for pattern in _ACTION_PATTERNS:
+            for match in pattern.finditer(text):
+                cleaned = match.group(1).strip()
                 if cleaned and len(cleaned) > 10:
                     responsibilities.append(cleaned)
         
@@ -351,42 +504,25 @@ class JobDescription:
         """Extract qualifications and education requirements."""
         qualifications = []
         
-        # Section headers
-        headers = [
-            r'Qualifications?:?',
-            r'Education\s*(?:Requirements?)?:?',
-            r'(?:Minimum\s+)?Requirements?:?',
-            r'Required\s+Education:?',
-        ]
-        
         # Find qualification sections
-        for header_pattern in headers:
-            pattern = rf'{header_pattern}\s*\n((?:[-•*]\s*[^\n]+\n?)+)'
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                lines = match.strip().split('\n')
-                for line in lines:
-                    cleaned = re.sub(r'^[-•*]\s*', '', line).strip()
-                    if cleaned:
-                        # Check if it's actually a qualification
-                        if any(word in cleaned.lower() for word in 
-                              ['degree', 'bachelor', 'master', 'phd', 'education', 
-                               'certification', 'diploma', 'years']):
-                            qualifications.append(cleaned)
-                        # Note: We don't add non-qualification items to responsibilities here
+        for match in _find_section_bodies(_QUALIFICATION_SECTION_PATTERNS, text):
+            lines = match.strip().split('\n')
+            for line in lines:
+                cleaned = _BULLET_RE.sub('', line).strip()
+                if cleaned:
+                    # Check if it's actually a qualification
+                    if any(word in cleaned.lower() for word in 
+                          ['degree', 'bachelor', 'master', 'phd', 'education', 
+                           'certification', 'diploma', 'years']):
+                        qualifications.append(cleaned)
+                    # Note: We don't add non-qualification items to responsibilities here
         
         # Look for degree mentions inline
-        degree_patterns = [
-            r'((?:Bachelor|Master|PhD|Doctoral)[\'\']?s?\s+(?:degree|Degree)\s+[^.]+)',
-            r'((?:BS|BA|MS|MA|MBA|PhD)\s+in\s+[^.]+)',
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if match not in qualifications:
-                    qualifications.append(match.strip())
+        for pattern in _DEGREE_PATTERNS:
+            for match in pattern.finditer(text):
+                degree = match.group(1)
+                if degree not in qualifications:
+                    qualifications.append(degree.strip())
         
         return qualifications
     
@@ -396,33 +532,17 @@ class JobDescription:
         skills = []
         
         # Remove bullet points
-        text = re.sub(r'^[-•*]\s*', '', text, flags=re.MULTILINE)
-        
-        # Split by common delimiters
-        if ',' in text:
-            # Comma-separated
-            parts = text.split(',')
-        elif '\n' in text:
-            # Line-separated
-            parts = text.split('\n')
-        else:
-            parts = [text]
-        
-        for part in parts:
-            # Clean up
-            skill = part.strip()
-            skill = re.sub(r'\s+', ' ', skill)  # Normalize whitespace
+        text = _BULLET_RE.sub('', text)
+        
+        for part in _SKILL_DELIMITER_RE.split(text):
+            # Clean up and normalize whitespace
+            skill = ' '.join(part.split())
+            if not skill:
+                continue
             
-            # Handle "X or Y" patterns
-            if ' or ' in skill.lower():
-                sub_skills = skill.split(' or ')
-                skills.extend([s.strip() for s in sub_skills if s.strip()])
-            elif ' and ' in skill.lower() and len(skill) < 50:
-                # Short "X and Y" might be separate skills
-                sub_skills = skill.split(' and ')
-                skills.extend([s.strip() for s in sub_skills if s.strip()])
-            elif skill:
-                skills.append(skill)
+            # Split "X or Y" patterns; short "X and Y" might be separate skills
+            splitter = _SKILL_CONJUNCTION_RE if len(skill) < 50 else _SKILL_OR_RE
+            skills.extend(s.strip() for s in splitter.split(skill) if s.strip())
         
         return skills
     
@@ -430,134 +550,81 @@ class JobDescription:
     def _normalize_skill(cls, skill: str) -> str:
         """Normalize skill name for consistency."""
         # Remove extra whitespace and punctuation
-        skill = skill.strip().strip('.,;:')
-        skill = re.sub(r'\s+', ' ', skill)
+        skill = ' '.join(skill.strip().strip('.,;:').split())
         
         # Remove common suffixes
-        skill = re.sub(r'\s*(?:experience|knowledge|skills?|expertise|proficiency)$', '', skill, flags=re.IGNORECASE)
+        lower_skill = skill.lower()
+        for suffix in _SKILL_SUFFIXES:
+            if lower_skill.endswith(suffix):
+                skill = skill[:-len(suffix)].rstrip()
+                break
         
         # Apply known normalizations
         lower_skill = skill.lower()
-        for variant, normalized in cls.SKILL_NORMALIZATIONS.items():
-            if lower_skill == variant:
-                return normalized
+        hit = cls.SKILL_NORMALIZATIONS.get(lower_skill)
+        if hit:
+            return hit
         
         # Handle variations like "Python programming" -> "Python"
-        programming_langs = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust']
-        for lang in programming_langs:
-            if lower_skill.startswith(lang + ' '):
-                # Extract just the language name
-                skill = lang
-                lower_skill = lang
+        if lower_skill.startswith(_LANGUAGE_PREFIXES):
+            # Extract just the language name (the first word)
+            skill = lower_skill = lower_skill.split(' ', 1)[0]
         
         # Capitalize appropriately
         # Known all-caps terms
-        all_caps = {'sql', 'html', 'css', 'xml', 'json', 'api', 'rest', 'aws', 'gcp', 'ci/cd', 'tdd', 'bdd'}
-        if lower_skill in all_caps:
+        if lower_skill in _ALL_CAPS_SKILLS:
             return skill.upper()
         
-        # Known mixed-case terms
-        mixed_case = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript', 
-            'python': 'Python',
-            'java': 'Java',
-            'c#': 'C#',
-            'c++': 'C++',
-            'node.js': 'Node.js',
-            'vue.js': 'Vue.js',
-            'angular.js': 'Angular.js',
-            'postgresql': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'mongodb': 'MongoDB',
-            'graphql': 'GraphQL',
-            'django': 'Django',
-            'flask': 'Flask',
-            'react': 'React',
-            'react.js': 'React',
-            'kubernetes': 'Kubernetes',
-            'docker': 'Docker',
-            'git': 'Git',
-            'github': 'GitHub',
-            'gitlab': 'GitLab',
-            'linux': 'Linux',
-            'macos': 'macOS',
-            'redis': 'Redis',
-            'elasticsearch': 'Elasticsearch',
-            'machine learning': 'Machine Learning',
-            'aws certification': 'AWS',
-            'graphql knowledge': 'GraphQL',
-            'docker containerization': 'Docker',
-            'rest api development': 'REST API',
-            'linux/unix proficiency': 'Linux/Unix',
-            'ml background': 'ML',
-            'mobile development': 'Mobile Development',
-        }
         
         # First check exact match
-        if lower_skill in mixed_case:
-            return mixed_case[lower_skill]
+        hit = _MIXED_CASE_SKILLS.get(lower_skill)
+        if hit:
+            return hit
         
         # Then check if skill contains known terms
-        for key, value in mixed_case.items():
+        for key, value in _MIXED_CASE_SKILLS.items():
             if key in lower_skill:
                 # Replace the known term with its normalized version
                 return value
         
-        # Default: capitalize first letter of each word
+        # Default: capitalize first letter of each word. str.title matches
+        # per-word capitalize only for plain words; it would also uppercase
+        # after apostrophes and slashes ("Bachelor'S", "Ci/Cd").
+        if _PLAIN_WORDS_RE.fullmatch(skill):
+            return skill.title()
         return ' '.join(word.capitalize() for word in skill.split())
     
     def _extract_keywords(self) -> Set[str]:
         """Extract ATS keywords from the job description."""
         keywords = set()
         
-        # Extract from all text content
-        text = self.raw_content.lower()
-        
-        # Technical terms and skills
-        technical_patterns = [
-            r'\b(?:python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|php|swift|kotlin)\b',
-            r'\b(?:react|angular|vue|django|flask|spring|rails|express|fastapi)\b',
-            r'\b(?:sql|nosql|postgresql|mysql|mongodb|redis|elasticsearch)\b',
-            r'\b(?:aws|azure|gcp|cloud|serverless|lambda|kubernetes|docker)\b',
-            r'\b(?:api|rest|restful|graphql|grpc|websocket|microservices)\b',
-            r'\b(?:git|github|gitlab|bitbucket|ci/cd|jenkins|travis|circle)\b',
-            r'\b(?:agile|scrum|kanban|waterfall|lean|devops)\b',
-            r'\b(?:tdd|bdd|unit\s+test|integration\s+test|e2e|testing)\b',
-            r'\b(?:machine\s+learning|ml|ai|artificial\s+intelligence|deep\s+learning|nlp)\b',
-            r'\b(?:data\s+science|analytics|visualization|etl|data\s+pipeline)\b',
-        ]
-        
-        for pattern in technical_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            keywords.update(match.lower() for match in matches)
+        # Technical terms and skills; the pattern ignores case, so only the
+        # matched terms are lowercased rather than a copy of the whole text
+        keywords.update(
+            match.group().lower() for match in _TECHNICAL_RE.finditer(self.raw_content)
+        )
         
         # Add skills as keywords
         for skill in self.required_skills + self.nice_to_have_skills:
-            keywords.add(skill.lower())
+            skill_lower = skill.lower()
+            keywords.add(skill_lower)
             # Also add individual words from multi-word skills
-            if len(skill.split()) > 1:
-                keywords.update(word.lower() for word in skill.split() 
-                              if len(word) > 2 and word.lower() not in {'and', 'the', 'for', 'with'})
-        
-        # Extract from responsibilities
-        action_verbs = ['design', 'develop', 'implement', 'build', 'create', 'optimize', 
-                       'lead', 'manage', 'architect', 'deploy', 'maintain', 'analyze']
-        for resp in self.responsibilities:
-            resp_lower = resp.lower()
-            for verb in action_verbs:
-                if verb in resp_lower:
-                    keywords.add(verb)
-        
-        # Clean up keywords
-        cleaned_keywords = set()
-        for keyword in keywords:
-            keyword = keyword.strip().lower()
-            # Remove very short or very long keywords
-            if 2 < len(keyword) < 30:
-                cleaned_keywords.add(keyword)
-        
-        return cleaned_keywords
+            words = skill_lower.split()
+            if len(words) > 1:
+                keywords.update(word for word in words 
+                              if len(word) > 2 and word not in _KEYWORD_STOPWORDS)
+        
+        # Extract from responsibilities in a single scan
+        if self.responsibilities:
+            responsibilities_text = '\n'.join(self.responsibilities).lower()
+            keywords.update(
+                match.group() for match in _ACTION_VERB_RE.finditer(responsibilities_text)
+            )
+        
+        # Remove very short or very long keywords; every source above is
+        # already lowercase and free of surrounding whitespace. Interning lets
+        # keyword sets from many postings share their common strings.
+        return {sys.intern(keyword) for keyword in keywords if 2 < len(keyword) < 30}
     
     def validate(self) -> List[str]:
         """
@@ -589,4 +656,10 @@ class JobDescription:
         if self.years_of_experience == 0 and len(errors) > 2:
             errors.append("Years of experience not specified")
         
-        return errors
\ No newline at end of file
+        return errors
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(cls: type, text: str) -> JobDescription:
+    """Memoized parse keyed by class and text; never hand out the result itself."""
+    return cls._parse(text)
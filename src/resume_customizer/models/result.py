@@ -3,15 +3,27 @@
 
 """Models for tracking and representing resume customization results."""
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Optional, Tuple
 import json
 import difflib
+import functools
+import io
+from collections import Counter
 from pathlib import Path
 
 
+# Number of recently analyzed texts whose lowercase copies are kept around;
+# each result contributes its original and customized content
+LOWERCASE_CACHE_SIZE = 8
+
+# Lowercase copies keyed by the text itself, so edits to a result's content
+# simply miss the cache instead of serving a stale copy
+_lowercase = functools.lru_cache(maxsize=LOWERCASE_CACHE_SIZE)(str.lower)
+
+
 class ChangeType(str, Enum):
     """Types of changes that can be made during customization."""
     CONTENT_REWRITE = "content_rewrite"
@@ -28,7 +40,7 @@ class DiffType(str, Enum):
     UNCHANGED = "unchanged"
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     """Represents a single change made during customization."""
     type: ChangeType
@@ -36,7 +48,7 @@ class Change:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionChange:
     """Represents a section reordering change."""
     original_position: int
@@ -44,7 +56,7 @@ class SectionChange:
     section_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordIntegration:
     """Represents keyword integration details."""
     keyword: str
@@ -52,7 +64,7 @@ class KeywordIntegration:
     sections: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffLine:
     """Represents a line in the diff output."""
     type: DiffType
@@ -86,123 +98,129 @@ class CustomizationResult:
         if not self.changes and not self.integrated_keywords and not self.reordered_sections:
             return "No changes made"
         
-        lines = [
-            f"Match Score: {self.match_score}%",
-            f"Total Changes: {len(self.changes)}",
-            f"Keywords Added: {len(self.integrated_keywords)}",
-            f"Sections Reordered: {len(self.reordered_sections)}",
-            ""
-        ]
+        buffer = io.StringIO()
+        write = buffer.write
+        write(
+            f"Match Score: {self.match_score}%\n"
+            f"Total Changes: {len(self.changes)}\n"
+            f"Keywords Added: {len(self.integrated_keywords)}\n"
+            f"Sections Reordered: {len(self.reordered_sections)}\n"
+        )
         
         if self.changes:
-            lines.append("Changes by Section:")
+            write("\nChanges by Section:")
             for change in self.changes:
-                lines.append(f"  - {change.section}: {change.description}")
+                write(f"\n  - {change.section}: {change.description}")
         
-        return "\n".join(lines)
+        return buffer.getvalue()
     
     def get_detailed_summary(self) -> str:
         """Generate a detailed summary with all information."""
-        lines = [
-            "=" * 50,
-            "RESUME CUSTOMIZATION SUMMARY",
-            "=" * 50,
-            f"Generated at: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Match Score: {self.match_score}%",
-            "",
-        ]
+        rule = "=" * 50
+        divider = "-" * 30
+        buffer = io.StringIO()
+        write = buffer.write
+        write(
+            f"{rule}\n"
+            f"RESUME CUSTOMIZATION SUMMARY\n"
+            f"{rule}\n"
+            f"Generated at: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Match Score: {self.match_score}%\n"
+        )
         
-        # Changes section
+        # Changes section; entries are separated by a blank line
         if self.changes:
-            lines.extend([
-                "Changes Applied:",
-                "-" * 30,
-            ])
+            write(f"\nChanges Applied:\n{divider}")
             for i, change in enumerate(self.changes, 1):
-                lines.append(f"{i}. [{change.type.value}] {change.section}")
-                lines.append(f"   {change.description}")
-                lines.append("")
+                write(f"\n{i}. [{change.type.value}] {change.section}\n   {change.description}\n")
         
         # Keywords section
         if self.integrated_keywords:
-            lines.extend([
-                "Integrated Keywords:",
-                "-" * 30,
-            ])
+            write(f"\nIntegrated Keywords:\n{divider}\n")
             for keyword in self.integrated_keywords:
-                lines.append(f"  - {keyword}")
-            lines.append("")
+                write(f"  - {keyword}\n")
         
         # Section reordering
         if self.reordered_sections:
-            lines.extend([
-                "Section Order Changes:",
-                "-" * 30,
-            ])
+            write(f"\nSection Order Changes:\n{divider}")
             for section in self.reordered_sections:
-                lines.append(
-                    f"  - {section.section_name} moved from position "
+                write(
+                    f"\n  - {section.section_name} moved from position "
                     f"{section.original_position} to position {section.new_position}"
                 )
         
-        return "\n".join(lines)
+        return buffer.getvalue()
     
-    def get_keyword_frequency(self) -> Dict[str, int]:
-        """Analyze keyword frequency in the customized content."""
-        freq = {}
-        content_lower = self.customized_content.lower()
+    def _count_keywords(self, content: str) -> List[Tuple[str, int]]:
+        """
+        Count occurrences of each integrated keyword, ignoring case.
         
-        for keyword in self.integrated_keywords:
-            keyword_lower = keyword.lower()
-            # Count whole word occurrences
-            count = content_lower.count(keyword_lower)
-            if count > 0:
-                freq[keyword] = count
+        The content is lowercased once for all keywords (and reused across
+        calls while it stays in the small module cache); each keyword is then
+        counted with str.count, which scans in C and, unlike a combined regex
+        alternation, counts keywords that overlap one another independently.
         
-        return freq
+        Args:
+            content: Text to search
+            
+        Returns:
+            (keyword, count) pairs in integrated_keywords order
+        """
+        content_lower = _lowercase(content)
+        return [
+            (keyword, content_lower.count(keyword.lower()))
+            for keyword in self.integrated_keywords
+        ]
+    
+    def get_keyword_frequency(self) -> Dict[str, int]:
+        """Analyze keyword frequency in the customized content."""
+        return {
+            keyword: count
+            for keyword, count in self._count_keywords(self.customized_content)
+            if count > 0
+        }
     
     def generate_diff(self) -> List[DiffLine]:
-        """Generate a diff between original and customized content."""
+        """
+        Generate a diff between original and customized content.
+        
+        Uses the opcodes of a line-level SequenceMatcher directly instead of
+        difflib.Differ, which additionally runs a character-level fuzzy match
+        over replaced blocks only to produce '?' hint lines.
+        
+        Returns:
+            Diff lines; unchanged and removed lines are numbered by their
+            position in the original, added lines by their position in the
+            customized content
+        """
         original_lines = self.original_content.splitlines()
+        
+        if self.original_content == self.customized_content:
+            return [
+                DiffLine(type=DiffType.UNCHANGED, content=line, line_num=line_num)
+                for line_num, line in enumerate(original_lines, 1)
+            ]
+        
         customized_lines = self.customized_content.splitlines()
+        matcher = difflib.SequenceMatcher(None, original_lines, customized_lines)
         
         diff_lines = []
-        original_line_num = 0
-        customized_line_num = 0
-        
-        differ = difflib.Differ()
-        diff = list(differ.compare(original_lines, customized_lines))
-        
-        for line in diff:
-            if line.startswith('  '):  # Unchanged
-                original_line_num += 1
-                customized_line_num += 1
-                diff_lines.append(
-                    DiffLine(
-                        type=DiffType.UNCHANGED,
-                        content=line[2:],
-                        line_num=original_line_num
-                    )
-                )
-            elif line.startswith('- '):  # Removed
-                original_line_num += 1
-                diff_lines.append(
-                    DiffLine(
-                        type=DiffType.REMOVED,
-                        content=line[2:],
-                        line_num=original_line_num
-                    )
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                diff_lines.extend(
+                    DiffLine(type=DiffType.UNCHANGED, content=original_lines[i], line_num=i + 1)
+                    for i in range(i1, i2)
                 )
-            elif line.startswith('+ '):  # Added
-                customized_line_num += 1
-                diff_lines.append(
-                    DiffLine(
-                        type=DiffType.ADDED,
-                        content=line[2:],
-                        line_num=customized_line_num
-                    )
-                )
-            # Skip '?' lines from differ
+                continue
+            # 'replace' emits the removed lines first, then the added ones
+            diff_lines.extend(
+                DiffLine(type=DiffType.REMOVED, content=original_lines[i], line_num=i + 1)
+                for i in range(i1, i2)
+            )
+            diff_lines.extend(
+                DiffLine(type=DiffType.ADDED, content=customized_lines[j], line_num=j + 1)
+                for j in range(j1, j2)
+            )
         
         return diff_lines
     
@@ -215,46 +233,62 @@ class CustomizationResult:
         RESET = "\033[0m"
         BOLD = "\033[1m"
         
-        lines = [
-            f"{BOLD}Resume Customization Complete!{RESET}",
-            "",
-            f"{GREEN}✓ Match Score: {self.match_score}%{RESET}",
-            "",
-            f"{BLUE}Changes Applied:{RESET}",
-        ]
-        
-        for change in self.changes:
-            lines.append(f"  {GREEN}✓{RESET} {change.section}: {change.description}")
+        output = (
+            f"{BOLD}Resume Customization Complete!{RESET}\n"
+            f"\n"
+            f"{GREEN}✓ Match Score: {self.match_score}%{RESET}\n"
+            f"\n"
+            f"{BLUE}Changes Applied:{RESET}"
+        ) + "".join(
+            f"\n  {GREEN}✓{RESET} {change.section}: {change.description}"
+            for change in self.changes
+        )
         
         if self.integrated_keywords:
-            lines.extend([
-                "",
-                f"{BLUE}Keywords Integrated:{RESET}",
-                f"  {YELLOW}{', '.join(self.integrated_keywords)}{RESET}"
-            ])
+            output += (
+                f"\n\n{BLUE}Keywords Integrated:{RESET}"
+                f"\n  {YELLOW}{', '.join(self.integrated_keywords)}{RESET}"
+            )
         
         if self.reordered_sections:
-            lines.extend([
-                "",
-                f"{BLUE}Sections Reordered:{RESET}",
-            ])
-            for section in self.reordered_sections:
-                lines.append(
-                    f"  {GREEN}↕{RESET} {section.section_name} "
-                    f"({section.original_position} → {section.new_position})"
-                )
+            output += f"\n\n{BLUE}Sections Reordered:{RESET}" + "".join(
+                f"\n  {GREEN}↕{RESET} {section.section_name} "
+                f"({section.original_position} → {section.new_position})"
+                for section in self.reordered_sections
+            )
         
-        return "\n".join(lines)
+        return output
     
     def to_dict(self) -> Dict:
-        """Convert the result to a dictionary."""
-        data = asdict(self)
-        # Convert datetime to ISO format string
-        data['timestamp'] = self.timestamp.isoformat()
-        # Convert enums to strings
-        for change in data['changes']:
-            change['type'] = change['type']
-        return data
+        """
+        Convert the result to a dictionary.
+        
+        Built field by field rather than with dataclasses.asdict, which
+        deep-copies every value, including both full resume texts.
+        """
+        return {
+            'original_content': self.original_content,
+            'customized_content': self.customized_content,
+            'match_score': self.match_score,
+            'changes': [
+                {
+                    'type': change.type.value,
+                    'section': change.section,
+                    'description': change.description,
+                }
+                for change in self.changes
+            ],
+            'integrated_keywords': list(self.integrated_keywords),
+            'reordered_sections': [
+                {
+                    'original_position': section.original_position,
+                    'new_position': section.new_position,
+                    'section_name': section.section_name,
+                }
+                for section in self.reordered_sections
+            ],
+            'timestamp': self.timestamp.isoformat(),
+        }
     
     def to_json(self) -> str:
         """Convert the result to JSON string."""
@@ -265,8 +299,9 @@ class CustomizationResult:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w') as f:
-            f.write(self.to_json())
+        # json.dumps escapes non-ASCII characters, so the payload encodes
+        # without any lookup of the platform's default text encoding
+        path.write_bytes(self.to_json().encode('ascii'))
     
     def calculate_improvement_percentage(self, original_keywords: int) -> float:
         """Calculate the percentage improvement in keyword coverage."""
@@ -286,53 +321,40 @@ class CustomizationResult:
             "match_score": self.match_score,
         }
         
-        # Count changes by type
+        # Count changes by type in a single pass
+        counts = Counter(change.type for change in self.changes)
         for change_type in ChangeType:
-            count = sum(1 for c in self.changes if c.type == change_type)
-            stats[f"{change_type.value}_count"] = count
+            stats[f"{change_type.value}_count"] = counts[change_type]
         
         return stats
     
     def export_as_markdown(self) -> str:
         """Export the result summary as markdown."""
-        lines = [
-            "# Resume Customization Report",
-            "",
-            f"**Generated**: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            f"## Match Score: {self.match_score}%",
-            "",
+        blocks = [
+            f"# Resume Customization Report\n"
+            f"\n"
+            f"**Generated**: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"\n"
+            f"## Match Score: {self.match_score}%\n"
         ]
         
         if self.changes:
-            lines.extend([
-                "### Changes Applied",
-                "",
-            ])
-            for change in self.changes:
-                lines.append(f"- **{change.section}**: {change.description}")
-            lines.append("")
+            blocks.append("### Changes Applied\n\n" + "".join(
+                f"- **{change.section}**: {change.description}\n" for change in self.changes
+            ))
         
         if self.integrated_keywords:
-            lines.extend([
-                "### Integrated Keywords",
-                "",
-            ])
-            for keyword in self.integrated_keywords:
-                lines.append(f"- {keyword}")
-            lines.append("")
+            blocks.append("### Integrated Keywords\n\n" + "".join(
+                f"- {keyword}\n" for keyword in self.integrated_keywords
+            ))
         
         if self.reordered_sections:
-            lines.extend([
-                "### Section Reordering",
-                "",
-            ])
-            for section in self.reordered_sections:
-                lines.append(
-                    f"- **{section.section_name}**: Position {section.original_position} → {section.new_position}"
-                )
+            blocks.append("### Section Reordering\n\n" + "\n".join(
+                f"- **{section.section_name}**: Position {section.original_position} → {section.new_position}"
+                for section in self.reordered_sections
+            ))
         
-        return "\n".join(lines)
+        return "\n".join(blocks)
     
     def get_comparison_metrics(self) -> Dict[str, float]:
         """Generate metrics comparing original and customized content."""
@@ -349,14 +371,16 @@ class CustomizationResult:
             ),
         }
         
-        # Keyword density
+        # Keyword density; unchanged content cannot change it
+        if self.original_content == self.customized_content:
+            metrics["keyword_density_change"] = 0
+            return metrics
+        
         original_keywords = sum(
-            self.original_content.lower().count(kw.lower())
-            for kw in self.integrated_keywords
+            count for _, count in self._count_keywords(self.original_content)
         )
         customized_keywords = sum(
-            self.customized_content.lower().count(kw.lower())
-            for kw in self.integrated_keywords
+            count for _, count in self._count_keywords(self.customized_content)
         )
         
         metrics["keyword_density_change"] = customized_keywords - original_keywords
@@ -3,6 +3,7 @@
 
 """Resume domain model for parsing and representing resume data."""
 
+import functools
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,8 +12,74 @@ from resume_customizer.utils.logging import get_logger
 
 logger = get_logger("models.resume")
 
+# Number of distinct header and lookup names kept normalized
+SECTION_NAME_CACHE_SIZE = 256
 
-@dataclass
+# Section name mappings for normalization; keys are lowercase header names
+SECTION_MAPPINGS = {
+    # Summary variations
+    "summary": "Summary",
+    "professional summary": "Summary",
+    "profile": "Summary",
+    "objective": "Summary",
+    "career objective": "Summary",
+    "executive summary": "Summary",
+    
+    # Experience variations
+    "experience": "Experience",
+    "work experience": "Experience",
+    "professional experience": "Experience",
+    "employment": "Experience",
+    "work history": "Experience",
+    "employment history": "Experience",
+    "career history": "Experience",
+    
+    # Skills variations
+    "skills": "Skills",
+    "technical skills": "Skills",
+    "core competencies": "Skills",
+    "competencies": "Skills",
+    "expertise": "Skills",
+    
+    # Education variations
+    "education": "Education",
+    "education & training": "Education",
+    "academic background": "Education",
+    "qualifications": "Education",
+    "certifications": "Education",
+}
+
+# Mapping keys found anywhere in a longer header ("Skills & Tools"); longer
+# keys are listed first so the most specific one wins at a given position
+_SECTION_KEY_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(key) for key in sorted(SECTION_MAPPINGS, key=len, reverse=True)
+    ) + r')\b'
+)
+
+# Contact details
+_NAME_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_NAME_SEPARATOR_RE = re.compile(r'\s*[\|•]\s*')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (555) 123-4567 or 555-123-4567 or 555.123.4567
+        r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',  # 555-123-4567
+    )
+]
+
+# Sections and their contents
+# Whitespace after the hashes may not cross into the next line
+_SECTION_HEADER_RE = re.compile(r'^##[^\S\n]+(.+)$', re.MULTILINE)
+_SKILL_CATEGORY_RE = re.compile(r'^[^:]+:\s*(.+)$')
+_MARKDOWN_EMPHASIS_RE = re.compile(r'\*+')
+_YEARS_RE = re.compile(
+    r'(\d+)\s*(?:\+\s*)?years?\s*(?:of\s*)?(?:experience|expertise)', re.IGNORECASE
+)
+_DATE_RANGE_RE = re.compile(r'\b(\d{4})\s*[-–]\s*(?:(\d{4})|Present|Current)\b', re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class Section:
     """Represents a section in a resume."""
     name: str  # Normalized name (e.g., "Experience")
@@ -32,41 +99,6 @@ class Resume:
     years_of_experience: Optional[int] = None
     experience_calculation_method: Optional[str] = None
     
-    # Section name mappings for normalization
-    SECTION_MAPPINGS = {
-        # Summary variations
-        "summary": "Summary",
-        "professional summary": "Summary",
-        "profile": "Summary",
-        "objective": "Summary",
-        "career objective": "Summary",
-        "executive summary": "Summary",
-        
-        # Experience variations
-        "experience": "Experience",
-        "work experience": "Experience",
-        "professional experience": "Experience",
-        "employment": "Experience",
-        "work history": "Experience",
-        "employment history": "Experience",
-        "career history": "Experience",
-        
-        # Skills variations
-        "skills": "Skills",
-        "technical skills": "Skills",
-        "core competencies": "Skills",
-        "competencies": "Skills",
-        "expertise": "Skills",
-        "qualifications": "Skills",
-        
-        # Education variations
-        "education": "Education",
-        "education & training": "Education",
-        "academic background": "Education",
-        "qualifications": "Education",
-        "certifications": "Education",
-    }
-    
     @classmethod
     def from_markdown(cls, markdown: str) -> "Resume":
         """
@@ -112,11 +144,11 @@ class Resume:
     @staticmethod
     def _extract_name(markdown: str) -> str:
         """Extract name from markdown, typically from first H1."""
-        h1_match = re.search(r'^#\s+(.+)$', markdown, re.MULTILINE)
+        h1_match = _NAME_RE.search(markdown)
         if h1_match:
             name = h1_match.group(1).strip()
             # Remove any trailing contact info from name line
-            name = re.split(r'\s*[\|•]\s*', name)[0].strip()
+            name = _NAME_SEPARATOR_RE.split(name, 1)[0].strip()
             return name
         return "Unknown"
     
@@ -124,8 +156,7 @@ class Resume:
     def _extract_email(markdown: str) -> Optional[str]:
         """Extract email address from markdown."""
         # Look for email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, markdown)
+        email_match = _EMAIL_RE.search(markdown)
         if email_match:
             return email_match.group(0)
         return None
@@ -134,13 +165,8 @@ class Resume:
     def _extract_phone(markdown: str) -> Optional[str]:
         """Extract phone number from markdown."""
         # Look for various phone formats
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (555) 123-4567 or 555-123-4567 or 555.123.4567
-            r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',  # 555-123-4567
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, markdown)
+        for pattern in _PHONE_PATTERNS:
+            phone_match = pattern.search(markdown)
             if phone_match:
                 return phone_match.group(0)
         return None
@@ -150,62 +176,62 @@ class Resume:
         """Parse markdown into sections based on headers."""
         sections = []
         
-        # Split by H2 headers (## Section Name)
-        section_pattern = r'^##\s+(.+)$'
-        lines = markdown.split('\n')
-        
-        current_section_name = None
-        current_section_content = []
-        current_original_name = None
+        # Find H2 headers (## Section Name); each body runs to the next header
+        headers = list(_SECTION_HEADER_RE.finditer(markdown))
+        # A virtual header one past the end keeps a trailing newline as a line
+        bounds = [header.start() for header in headers[1:]] + [len(markdown) + 1]
         
-        for line in lines:
-            header_match = re.match(section_pattern, line)
-            
-            if header_match:
-                # Save previous section if exists
-                if current_section_name and current_section_content:
-                    content = '\n'.join(current_section_content).strip()
-                    normalized_name = cls._normalize_section_name(current_section_name)
-                    sections.append(Section(
-                        name=normalized_name,
-                        content=content,
-                        original_name=current_original_name
-                    ))
-                
-                # Start new section
-                current_original_name = header_match.group(1).strip()
-                current_section_name = current_original_name
-                current_section_content = []
-            else:
-                # Add line to current section
-                if current_section_name:
-                    current_section_content.append(line)
-        
-        # Save last section
-        if current_section_name and current_section_content:
-            content = '\n'.join(current_section_content).strip()
-            normalized_name = cls._normalize_section_name(current_section_name)
+        for header, bound in zip(headers, bounds):
+            # Blank headers, and headers directly followed by another header
+            # (or the end of the text), have no content lines and are skipped
+            original_name = header.group(1).strip()
+            if not original_name or bound - header.end() <= 1:
+                continue
             sections.append(Section(
-                name=normalized_name,
-                content=content,
-                original_name=current_original_name
+                name=cls._normalize_section_name(original_name),
+                content=markdown[header.end():bound].strip(),
+                original_name=original_name
             ))
         
         return sections
     
-    @classmethod
-    def _normalize_section_name(cls, name: str) -> str:
-        """Normalize section name to standard form."""
+    @staticmethod
+    @functools.lru_cache(maxsize=SECTION_NAME_CACHE_SIZE)
+    def _normalize_section_name(name: str) -> str:
+        """
+        Normalize section name to standard form.
+        
+        Exact header names are looked up directly; otherwise the earliest
+        mapping key contained in the header decides, so "Professional Work
+        Experience 2010-2020" still normalizes to "Experience". Headers
+        without any known key keep their original name.
+        """
         normalized = name.lower().strip()
-        return cls.SECTION_MAPPINGS.get(normalized, name)
+        mapped = SECTION_MAPPINGS.get(normalized)
+        if mapped:
+            return mapped
+        match = _SECTION_KEY_RE.search(normalized)
+        return SECTION_MAPPINGS[match.group()] if match else name
     
     def get_section(self, name: str) -> Optional[Section]:
-        """Get a section by name (case-insensitive)."""
-        normalized_name = self._normalize_section_name(name)
+        """
+        Get a section by name (case-insensitive).
+        
+        Sections whose header is itself a known name ("Work Experience") are
+        preferred over ones that only contain it ("Volunteer Experience"),
+        which are returned only when no exact match exists.
+        """
+        target = self._normalize_section_name(name).lower()
+        fallback = None
         for section in self.sections:
-            if section.name.lower() == normalized_name.lower():
+            if section.name.lower() != target:
+                continue
+            header = (section.original_name or section.name).lower().strip()
+            if header in SECTION_MAPPINGS or header == target:
                 return section
-        return None
+            if fallback is None:
+                fallback = section
+        return fallback
     
     def _extract_skills(self) -> List[str]:
         """Extract skills from the Skills section."""
@@ -219,13 +245,12 @@ class Resume:
         
         # Extract skills from various formats
         # Format 1: Category: skill1, skill2, skill3
-        category_pattern = r'^[^:]+:\s*(.+)$'
         for line in content.split('\n'):
-            match = re.match(category_pattern, line)
+            match = _SKILL_CATEGORY_RE.match(line)
             if match:
                 skill_list = match.group(1)
                 # Remove markdown formatting like ** from skills
-                skill_list = re.sub(r'\*+', '', skill_list)
+                skill_list = _MARKDOWN_EMPHASIS_RE.sub('', skill_list)
                 skills.extend([s.strip() for s in skill_list.split(',') if s.strip()])
             # Format 2: Bullet points with comma-separated skills
             elif line.strip().startswith('-'):
@@ -236,14 +261,7 @@ class Resume:
                 skills.extend([s.strip() for s in line.split(',') if s.strip()])
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in skills:
-            if skill not in seen:
-                seen.add(skill)
-                unique_skills.append(skill)
-        
-        return unique_skills
+        return list(dict.fromkeys(skills))
     
     def _calculate_experience(self) -> Tuple[Optional[int], Optional[str]]:
         """Calculate years of experience from resume content."""
@@ -251,8 +269,7 @@ class Resume:
         summary = self.get_section("Summary")
         if summary:
             # Look for patterns like "8 years of experience"
-            years_pattern = r'(\d+)\s*(?:\+\s*)?years?\s*(?:of\s*)?(?:experience|expertise)'
-            match = re.search(years_pattern, summary.content, re.IGNORECASE)
+            match = _YEARS_RE.search(summary.content)
             if match:
                 return int(match.group(1)), "from_summary"
         
@@ -260,22 +277,16 @@ class Resume:
         experience = self.get_section("Experience")
         if experience:
             # Find all year ranges
-            date_pattern = r'\b(\d{4})\s*[-–]\s*(?:(\d{4})|Present|Current)\b'
-            matches = re.findall(date_pattern, experience.content, re.IGNORECASE)
+            matches = _DATE_RANGE_RE.findall(experience.content)
             
             if matches:
-                earliest_year = None
-                latest_year = datetime.now().year
-                
-                for start_year, end_year in matches:
-                    start = int(start_year)
-                    if earliest_year is None or start < earliest_year:
-                        earliest_year = start
-                    
-                    if end_year and end_year not in ['Present', 'Current']:
-                        end = int(end_year)
-                        if end > latest_year:
-                            latest_year = end
+                # Ongoing roles ("Present"/"Current") leave the end year empty
+                # and count up to the current year
+                earliest_year = min(int(start_year) for start_year, _ in matches)
+                latest_year = max(
+                    [datetime.now().year]
+                    + [int(end_year) for _, end_year in matches if end_year]
+                )
                 
                 if earliest_year:
                     return latest_year - earliest_year, "from_dates"
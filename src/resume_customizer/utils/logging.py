@@ -3,22 +3,34 @@
 
 """Logging configuration for resume customizer."""
 
+import functools
 import os
 import sys
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Any, Dict
 
 
 # Global flag to track if logging has been configured
 _logging_configured = False
 
+# Standard LogRecord attributes; anything else on a record is an extra field
+_RESERVED_LOG_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename',
+    'funcName', 'levelname', 'levelno', 'lineno',
+    'module', 'msecs', 'message', 'pathname', 'process',
+    'processName', 'relativeCreated', 'thread', 'threadName',
+    'exc_info', 'exc_text', 'stack_info',
+})
+
 
 def reset_logging() -> None:
     """Reset logging configuration. Useful for testing."""
     global _logging_configured
     _logging_configured = False
+    # Forget handed-out loggers so the next get_logger call configures again
+    get_logger.cache_clear()
 
 
 class JSONFormatter(logging.Formatter):
@@ -26,8 +38,11 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # Reuse the creation time logging already recorded instead of reading
+        # the clock again; naive UTC keeps the previous timestamp format
+        created = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': created.isoformat(),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -38,11 +53,7 @@ class JSONFormatter(logging.Formatter):
         
         # Add any extra fields
         for key, value in record.__dict__.items():
-            if key not in ('name', 'msg', 'args', 'created', 'filename', 
-                          'funcName', 'levelname', 'levelno', 'lineno', 
-                          'module', 'msecs', 'message', 'pathname', 'process',
-                          'processName', 'relativeCreated', 'thread', 'threadName',
-                          'exc_info', 'exc_text', 'stack_info'):
+            if key not in _RESERVED_LOG_ATTRS:
                 log_data[key] = value
         
         # Add exception info if present
@@ -108,10 +119,14 @@ def configure_logging() -> None:
     _logging_configured = True
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger instance.
     
+    Loggers are memoized per name, so repeat calls skip the configuration
+    check and the logging manager lookup; reset_logging clears the cache.
+    
     Args:
         name: Optional name for child logger. If provided, creates a child
               logger under 'resume_customizer.{name}'
@@ -10,33 +10,38 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from resume_customizer.core.claude_client import ClaudeClient
-from resume_customizer.config import Settings
+from resume_customizer.core.claude_client import CLAUDE_PRICING, ClaudeClient
+from resume_customizer.config import get_settings
 
 
 async def test_claude_client():
     """Test ClaudeClient with various scenarios."""
-    print("Testing ClaudeClient functionality...\n")
+    # Collect output and write it in one go at the end
+    lines = []
+    out = lines.append
+    
+    out("Testing ClaudeClient functionality...\n")
     
     # Note: This demo uses mocked responses since we're not making real API calls
-    print("1. Client Initialization:")
+    out("1. Client Initialization:")
     try:
         # This would normally load from .env
-        settings = Settings(
+        settings = get_settings(
             claude_api_key="test-key-for-demo",
             model="claude-3-5-sonnet-20241022",
             max_tokens=1000,
             temperature=0.7
         )
-        print(f"   ✓ Settings loaded")
-        print(f"   ✓ Model: {settings.model}")
-        print(f"   ✓ Max tokens: {settings.max_tokens}")
-        print(f"   ✓ Temperature: {settings.temperature}")
+        out(f"   ✓ Settings loaded")
+        out(f"   ✓ Model: {settings.model}")
+        out(f"   ✓ Max tokens: {settings.max_tokens}")
+        out(f"   ✓ Temperature: {settings.temperature}")
     except Exception as e:
-        print(f"   ✗ Settings error: {e}")
+        out(f"   ✗ Settings error: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
-    print("\n2. Query Examples (Simulated):")
+    out("\n2. Query Examples (Simulated):")
     
     # Example prompts
     prompts = [
@@ -58,36 +63,36 @@ async def test_claude_client():
     ]
     
     # Simulate responses
-    print("   Note: Using simulated responses for demonstration\n")
+    out("   Note: Using simulated responses for demonstration\n")
+    
+    # Per-million-token rates from the client's pricing table
+    pricing = CLAUDE_PRICING[settings.model]
+    costs = [
+        (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+        for input_tokens, output_tokens in (p['tokens'] for p in prompts)
+    ]
     
-    total_cost = 0.0
-    for i, example in enumerate(prompts, 1):
-        print(f"   Query {i}:")
-        print(f"   - Prompt: '{example['prompt'][:50]}...'")
+    for i, (example, query_cost) in enumerate(zip(prompts, costs), 1):
+        out(f"   Query {i}:")
+        out(f"   - Prompt: '{example['prompt'][:50]}...'")
         if example['system']:
-            print(f"   - System: '{example['system'][:50]}...'")
+            out(f"   - System: '{example['system'][:50]}...'")
         
         # Simulate token usage
         input_tokens, output_tokens = example['tokens']
         total_tokens = input_tokens + output_tokens
         
-        # Calculate cost
-        cost_per_input = 3.0 / 1000  # $3 per million input tokens
-        cost_per_output = 15.0 / 1000  # $15 per million output tokens
-        query_cost = (input_tokens / 1000) * cost_per_input + (output_tokens / 1000) * cost_per_output
-        total_cost += query_cost
-        
-        print(f"   - Tokens: {input_tokens} in, {output_tokens} out ({total_tokens} total)")
-        print(f"   - Cost: ${query_cost:.4f}")
-        print()
+        out(f"   - Tokens: {input_tokens} in, {output_tokens} out ({total_tokens} total)")
+        out(f"   - Cost: ${query_cost:.4f}")
+        out("")
     
-    print(f"3. Usage Summary:")
-    print(f"   - Total queries: {len(prompts)}")
-    print(f"   - Total tokens: {sum(sum(p['tokens']) for p in prompts)}")
-    print(f"   - Total cost: ${total_cost:.4f}")
-    print()
+    out(f"3. Usage Summary:")
+    out(f"   - Total queries: {len(prompts)}")
+    out(f"   - Total tokens: {sum(sum(p['tokens']) for p in prompts)}")
+    out(f"   - Total cost: ${sum(costs):.4f}")
+    out("")
     
-    print("4. Error Handling Examples:")
+    out("4. Error Handling Examples:")
     error_scenarios = [
         ("Rate limit error", "429", "ClaudeRateLimitError"),
         ("Invalid API key", "401", "ClaudeAPIError"),
@@ -96,14 +101,14 @@ async def test_claude_client():
     ]
     
     for scenario, code, error_type in error_scenarios:
-        print(f"   - {scenario}: Would raise {error_type}")
+        out(f"   - {scenario}: Would raise {error_type}")
     
-    print("\n5. Retry Logic:")
-    print("   - Max retries: 3")
-    print("   - Retry delay: 1.0s (exponential backoff)")
-    print("   - Handles rate limits automatically")
+    out("\n5. Retry Logic:")
+    out("   - Max retries: 3")
+    out("   - Retry delay: 1.0s (exponential backoff)")
+    out("   - Handles rate limits automatically")
     
-    print("\n6. Model Support:")
+    out("\n6. Model Support:")
     models = [
         ("Claude 3 Opus", "claude-3-opus-20240229", "$15/$75"),
         ("Claude 3.5 Sonnet", "claude-3-5-sonnet-20241022", "$3/$15"),
@@ -111,9 +116,10 @@ async def test_claude_client():
     ]
     
     for name, model_id, pricing in models:
-        print(f"   - {name}: {pricing} per million tokens")
+        out(f"   - {name}: {pricing} per million tokens")
     
-    print("\nClaudeClient demo completed! ✅")
+    out("\nClaudeClient demo completed! ✅")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
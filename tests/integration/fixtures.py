@@ -4,21 +4,25 @@
 """Test fixtures for integration tests."""
 
 import os
-import tempfile
+import re
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Tuple, Any
+from typing import Dict, Iterator, Tuple, Any
 import pytest
-from datetime import datetime
 
 
-class TestDataFixtures:
-    """Provides test data for integration tests."""
-    
-    @staticmethod
-    def get_sample_resume(experience_level: str = "mid") -> str:
-        """Get a sample resume based on experience level."""
-        resumes = {
-            "entry": """# Alex Johnson
+# Name heading and email address looked for by the content preservation check
+_NAME_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+
+# Markup the ATS check treats as images or tables, matched in a single pass
+_IMAGE_RE = re.compile(r'<img|!\[|\.(?:png|jpe?g)', re.IGNORECASE)
+_TABLE_RE = re.compile(r'<table', re.IGNORECASE)
+
+# Sample documents, built once at import and served by TestDataFixtures
+_RESUMES: Dict[str, str] = {
+    "entry": """# Alex Johnson
 
 ## Contact Information
 - Email: alex.johnson@email.com
@@ -52,7 +56,7 @@ Recent computer science graduate passionate about software development and eager
 - Tools: Git, VS Code, Linux
 - Other: Agile methodologies, Problem solving""",
 
-            "mid": """# Sarah Chen
+    "mid": """# Sarah Chen
 
 ## Contact Information
 - Email: sarah.chen@techmail.com
@@ -103,7 +107,7 @@ Experienced full-stack developer with 5 years of experience building scalable we
 - AWS Certified Developer - Associate (2022)
 - Python Institute PCEP Certification (2020)""",
 
-            "senior": """# Michael Rodriguez
+    "senior": """# Michael Rodriguez
 
 ## Contact Information
 - Email: michael.rodriguez@techleader.com
@@ -184,15 +188,11 @@ Accomplished Principal Software Engineer with 12+ years of experience architecti
 - "Efficient State Management in Distributed Systems" - IEEE Conference (2021)
 - Patent: "Method for Dynamic Resource Allocation in Cloud Environments" (2020)
 - "Building Resilient Microservices" - Tech Blog Series (2019)"""
-        }
-        
-        return resumes.get(experience_level, resumes["mid"])
-    
-    @staticmethod
-    def get_sample_job_description(job_type: str = "standard") -> str:
-        """Get a sample job description."""
-        job_descriptions = {
-            "standard": """# Software Engineer - Cloud Platform Team
+}
+
+
+_JOB_DESCRIPTIONS: Dict[str, str] = {
+    "standard": """# Software Engineer - Cloud Platform Team
 
 ## About the Company
 TechInnovate is a leading cloud infrastructure company providing cutting-edge solutions to Fortune 500 companies. We're building the next generation of cloud platforms that power critical business applications worldwide.
@@ -234,7 +234,7 @@ We're seeking a talented Software Engineer to join our Cloud Platform team. You'
 - State-of-the-art equipment and tools
 - Collaborative and inclusive work environment""",
 
-            "senior": """# Senior/Staff Software Engineer - Platform Architecture
+    "senior": """# Senior/Staff Software Engineer - Platform Architecture
 
 ## About Us
 GlobalTech Systems is transforming how enterprises manage their digital infrastructure. Our platform processes billions of transactions daily and serves customers in over 100 countries. We're looking for exceptional engineers to help us scale to the next level.
@@ -291,7 +291,7 @@ As a Senior/Staff Software Engineer on our Platform Architecture team, you'll be
 - Opportunity to mentor and grow with the team
 - Direct impact on product used by millions""",
 
-            "ai_ml": """# Machine Learning Engineer - AI Products Team
+    "ai_ml": """# Machine Learning Engineer - AI Products Team
 
 ## Company Overview
 AI Innovations Corp is at the forefront of artificial intelligence, developing cutting-edge solutions that transform how businesses operate. Our AI-powered products serve millions of users across healthcare, finance, and e-commerce sectors.
@@ -344,7 +344,7 @@ We're looking for a talented Machine Learning Engineer to join our AI Products t
 - Conference attendance and paper publication support
 - Flexible work arrangements""",
 
-            "minimal": """# Python Developer Needed
+    "minimal": """# Python Developer Needed
 
 We need a Python developer with 3+ years of experience.
 
@@ -355,25 +355,21 @@ Key requirements:
 - Team player
 
 Send your resume to: hiring@company.com"""
-        }
-        
-        return job_descriptions.get(job_type, job_descriptions["standard"])
+}
+
+
+_EDGE_CASES: Dict[str, str] = {
+    "minimal": "# Jane Doe\nSoftware Developer",
     
-    @staticmethod
-    def get_edge_case_resume(case_type: str) -> str:
-        """Get edge case resumes for testing."""
-        edge_cases = {
-            "minimal": "# Jane Doe\nSoftware Developer",
-            
-            "no_experience": """# Recent Graduate
+    "no_experience": """# Recent Graduate
 
 ## Education
 BS Computer Science - State University (2024)
 
 ## Skills
 Python, Java, JavaScript""",
-            
-            "career_change": """# Pat Smith
+    
+    "career_change": """# Pat Smith
 
 ## Summary
 Former teacher transitioning to software development after completing bootcamp.
@@ -394,8 +390,8 @@ Former teacher transitioning to software development after completing bootcamp.
 - JavaScript, React, Node.js
 - Problem solving
 - Communication""",
-            
-            "overqualified": """# Dr. Expert McExpert, PhD
+    
+    "overqualified": """# Dr. Expert McExpert, PhD
 
 ## Summary
 30 years of experience. Published 50 papers. Founded 3 companies. Know 20 programming languages.
@@ -410,9 +406,62 @@ Former teacher transitioning to software development after completing bootcamp.
 
 ## Skills
 [Lists every technology ever invented]"""
-        }
-        
-        return edge_cases.get(case_type, edge_cases["minimal"])
+}
+
+
+def _has_n_hashes(content: str, n: int = 3) -> bool:
+    """Check for at least n '#' characters, stopping at the n-th one."""
+    start = 0
+    for _ in range(n):
+        index = content.find('#', start)
+        if index < 0:
+            return False
+        start = index + 1
+    return True
+
+
+class _LazyFileMap(Mapping):
+    """Maps file names to paths, writing each file when it is first looked up."""
+    
+    def __init__(self, directory: Path, contents: Dict[str, str]):
+        self._directory = directory
+        self._contents = contents
+        self._paths: Dict[str, str] = {}
+    
+    def __getitem__(self, filename: str) -> str:
+        path = self._paths.get(filename)
+        if path is None:
+            content = self._contents[filename]
+            file_path = self._directory / filename
+            # Bytes skip the text layer; the samples use '\n' line endings as-is
+            file_path.write_bytes(content.encode('utf-8'))
+            path = self._paths[filename] = str(file_path)
+        return path
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._contents)
+    
+    def __len__(self) -> int:
+        return len(self._contents)
+
+
+class TestDataFixtures:
+    """Provides test data for integration tests."""
+    
+    @staticmethod
+    def get_sample_resume(experience_level: str = "mid") -> str:
+        """Get a sample resume based on experience level."""
+        return _RESUMES.get(experience_level, _RESUMES["mid"])
+    
+    @staticmethod
+    def get_sample_job_description(job_type: str = "standard") -> str:
+        """Get a sample job description."""
+        return _JOB_DESCRIPTIONS.get(job_type, _JOB_DESCRIPTIONS["standard"])
+    
+    @staticmethod
+    def get_edge_case_resume(case_type: str) -> str:
+        """Get edge case resumes for testing."""
+        return _EDGE_CASES.get(case_type, _EDGE_CASES["minimal"])
 
 
 @pytest.fixture
@@ -421,48 +470,56 @@ def test_data_manager():
     return TestDataFixtures()
 
 
+@pytest.fixture(scope="session")
+def shared_test_inputs(tmp_path_factory):
+    """
+    Creates the resume and job files shared by every test in the session.
+    
+    Tests only read these files, so they are built once; anything a test
+    writes goes into its own directory from temp_test_environment.
+    """
+    base_path = tmp_path_factory.mktemp("integration_inputs")
+    
+    # Create directory structure
+    (base_path / "resumes").mkdir()
+    (base_path / "jobs").mkdir()
+    
+    # Create test files
+    files = {
+        "resumes": {
+            "mid_level.md": TestDataFixtures.get_sample_resume("mid"),
+            "entry_level.md": TestDataFixtures.get_sample_resume("entry"),
+            "senior_level.md": TestDataFixtures.get_sample_resume("senior"),
+            "minimal.md": TestDataFixtures.get_edge_case_resume("minimal"),
+            "career_change.md": TestDataFixtures.get_edge_case_resume("career_change")
+        },
+        "jobs": {
+            "standard_swe.md": TestDataFixtures.get_sample_job_description("standard"),
+            "senior_role.md": TestDataFixtures.get_sample_job_description("senior"),
+            "ai_ml_role.md": TestDataFixtures.get_sample_job_description("ai_ml"),
+            "minimal_posting.md": TestDataFixtures.get_sample_job_description("minimal")
+        }
+    }
+    
+    # Files are only written once a test asks for their path
+    return {
+        category: _LazyFileMap(base_path / category, file_dict)
+        for category, file_dict in files.items()
+    }
+
+
 @pytest.fixture
-def temp_test_environment():
+def temp_test_environment(shared_test_inputs, tmp_path):
     """Creates a complete test environment with multiple files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir)
-        
-        # Create directory structure
-        (base_path / "resumes").mkdir()
-        (base_path / "jobs").mkdir()
-        (base_path / "output").mkdir()
-        
-        # Create test files
-        files = {
-            "resumes": {
-                "mid_level.md": TestDataFixtures.get_sample_resume("mid"),
-                "entry_level.md": TestDataFixtures.get_sample_resume("entry"),
-                "senior_level.md": TestDataFixtures.get_sample_resume("senior"),
-                "minimal.md": TestDataFixtures.get_edge_case_resume("minimal"),
-                "career_change.md": TestDataFixtures.get_edge_case_resume("career_change")
-            },
-            "jobs": {
-                "standard_swe.md": TestDataFixtures.get_sample_job_description("standard"),
-                "senior_role.md": TestDataFixtures.get_sample_job_description("senior"),
-                "ai_ml_role.md": TestDataFixtures.get_sample_job_description("ai_ml"),
-                "minimal_posting.md": TestDataFixtures.get_sample_job_description("minimal")
-            }
-        }
-        
-        # Write all files
-        created_files = {}
-        for category, file_dict in files.items():
-            created_files[category] = {}
-            for filename, content in file_dict.items():
-                file_path = base_path / category / filename
-                file_path.write_text(content, encoding='utf-8')
-                created_files[category][filename] = str(file_path)
-        
-        # Add paths to output
-        created_files["output_dir"] = str(base_path / "output")
-        created_files["base_path"] = str(base_path)
-        
-        yield created_files
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    # Shared inputs plus per-test paths for output
+    return {
+        **shared_test_inputs,
+        "output_dir": str(output_dir),
+        "base_path": str(tmp_path)
+    }
 
 
 @pytest.fixture
@@ -483,10 +540,10 @@ def performance_tracker():
             }
         
         def start(self):
-            self.metrics["start_time"] = datetime.now()
+            self.metrics["start_time"] = time.perf_counter()
         
         def stop(self):
-            self.metrics["end_time"] = datetime.now()
+            self.metrics["end_time"] = time.perf_counter()
         
         def add_api_call(self, tokens: int = 0):
             self.metrics["api_calls"] += 1
@@ -497,9 +554,9 @@ def performance_tracker():
                 self.metrics["file_operations"][operation] += 1
         
         def get_duration(self) -> float:
-            if self.metrics["start_time"] and self.metrics["end_time"]:
-                delta = self.metrics["end_time"] - self.metrics["start_time"]
-                return delta.total_seconds()
+            # Monotonic perf_counter readings, in seconds
+            if self.metrics["start_time"] is not None and self.metrics["end_time"] is not None:
+                return self.metrics["end_time"] - self.metrics["start_time"]
             return 0.0
         
         def get_summary(self) -> Dict[str, Any]:
@@ -521,23 +578,22 @@ def quality_validator():
         @staticmethod
         def check_ats_compliance(content: str) -> Dict[str, bool]:
             """Check if resume is ATS-compliant."""
+            lower = content.lower()
+            
             checks = {
                 "has_contact_section": any(
-                    section in content.lower() 
+                    section in lower
                     for section in ["contact", "email", "phone"]
                 ),
                 "has_experience_section": any(
-                    section in content.lower() 
+                    section in lower
                     for section in ["experience", "work history", "employment"]
                 ),
-                "has_skills_section": "skills" in content.lower(),
-                "has_education_section": "education" in content.lower(),
-                "no_tables": "<table" not in content.lower(),
-                "no_images": not any(
-                    img in content.lower() 
-                    for img in ["<img", "![", ".png", ".jpg", ".jpeg"]
-                ),
-                "proper_headings": content.count("#") >= 3
+                "has_skills_section": "skills" in lower,
+                "has_education_section": "education" in lower,
+                "no_tables": _TABLE_RE.search(content) is None,
+                "no_images": _IMAGE_RE.search(content) is None,
+                "proper_headings": _has_n_hashes(content)
             }
             return checks
         
@@ -576,22 +632,23 @@ def quality_validator():
             checks = {}
             
             # Check name preservation (assumes first # heading is name)
-            import re
-            name_match = re.search(r'^#\s+(.+)$', original, re.MULTILINE)
+            name_match = _NAME_RE.search(original)
             if name_match:
                 name = name_match.group(1).strip()
                 checks["name_preserved"] = name in customized
             
             # Check contact info preservation
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', original)
+            email_match = _EMAIL_RE.search(original)
             if email_match:
                 email = email_match.group(0)
                 checks["email_preserved"] = email in customized
             
             # Check if major sections are preserved
+            original_lower = original.lower()
+            customized_lower = customized.lower()
             for section in ["experience", "education", "skills"]:
-                if section in original.lower():
-                    checks[f"{section}_section_preserved"] = section in customized.lower()
+                if section in original_lower:
+                    checks[f"{section}_section_preserved"] = section in customized_lower
             
             return checks
         
@@ -6,9 +6,10 @@
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 
+import pytest
+
 def main():
     """Run integration tests with proper setup."""
     # Check for API key
@@ -26,9 +27,10 @@ def main():
     print("\nRunning integration tests with real Claude Code SDK...")
     print("This will make actual API calls and may take a few moments.\n")
     
-    # Run pytest with integration marker
-    cmd = [
-        sys.executable, "-m", "pytest",
+    # Run pytest in this interpreter, from the project root, with the
+    # integration marker
+    os.chdir(Path(__file__).parent.parent.parent)
+    args = [
         "tests/integration/test_claude_integration.py",
         "-v",
         "-s",  # Show print statements
@@ -36,12 +38,8 @@ def main():
         "--tb=short"  # Shorter traceback
     ]
     
-    try:
-        result = subprocess.run(cmd, cwd=Path(__file__).parent.parent.parent)
-        return result.returncode
-    except KeyboardInterrupt:
-        print("\n\nTests interrupted by user")
-        return 1
+    # pytest.main reports a Ctrl-C as ExitCode.INTERRUPTED
+    return int(pytest.main(args))
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
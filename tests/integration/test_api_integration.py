@@ -13,7 +13,7 @@ import time
 
 from resume_customizer.core.claude_client import ClaudeClient
 from resume_customizer.config import Settings
-from tests.integration.fixtures import test_data_manager, temp_test_environment
+from tests.integration.fixtures import test_data_manager, temp_test_environment, shared_test_inputs
 
 
 @pytest.mark.integration
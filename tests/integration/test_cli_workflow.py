@@ -15,7 +15,7 @@ from unittest.mock import patch
 
 from resume_customizer.cli.app import cli
 from resume_customizer.config import Settings
-from tests.integration.fixtures import test_data_manager, temp_test_environment, performance_tracker
+from tests.integration.fixtures import test_data_manager, temp_test_environment, performance_tracker, shared_test_inputs
 
 
 @pytest.mark.integration
@@ -13,7 +13,7 @@ import shutil
 
 from resume_customizer.core.customizer import ResumeCustomizer
 from resume_customizer.config import Settings
-from tests.integration.fixtures import test_data_manager, temp_test_environment
+from tests.integration.fixtures import test_data_manager, temp_test_environment, shared_test_inputs
 
 
 @pytest.mark.integration
@@ -16,7 +16,7 @@ import json
 
 from resume_customizer.core.customizer import ResumeCustomizer
 from resume_customizer.config import Settings
-from tests.integration.fixtures import test_data_manager, temp_test_environment, performance_tracker
+from tests.integration.fixtures import test_data_manager, temp_test_environment, performance_tracker, shared_test_inputs
 
 
 @pytest.mark.integration
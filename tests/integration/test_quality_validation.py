@@ -11,7 +11,7 @@ from collections import Counter
 
 from resume_customizer.core.customizer import ResumeCustomizer
 from resume_customizer.config import Settings
-from tests.integration.fixtures import test_data_manager, temp_test_environment, quality_validator
+from tests.integration.fixtures import test_data_manager, temp_test_environment, quality_validator, shared_test_inputs
 
 
 @pytest.mark.integration
@@ -171,6 +171,39 @@ RESUME_MAX_ITERATIONS=5
         
         assert settings1 is settings2  # Same instance
     
+    def test_get_settings_caches_overrides(self, clean_env):
+        """Test that get_settings() caches one instance per set of overrides."""
+        os.environ['ANTHROPIC_API_KEY'] = 'test-api-key'
+        get_settings.cache_clear()
+        
+        settings1 = get_settings(max_tokens=1000)
+        settings2 = get_settings(max_tokens=1000)
+        
+        assert settings1 is settings2
+        assert settings1.max_tokens == 1000
+        assert get_settings() is not settings1
+    
+    def test_get_settings_cache_ignores_keyword_order(self, clean_env):
+        """Test that the same overrides in a different order share a cache entry."""
+        os.environ['ANTHROPIC_API_KEY'] = 'test-api-key'
+        get_settings.cache_clear()
+        
+        settings1 = get_settings(max_tokens=1000, temperature=0.2)
+        settings2 = get_settings(temperature=0.2, max_tokens=1000)
+        
+        assert settings1 is settings2
+    
+    def test_get_settings_with_unhashable_override(self, clean_env):
+        """Test that unhashable override values bypass the cache instead of raising."""
+        os.environ['ANTHROPIC_API_KEY'] = 'test-api-key'
+        get_settings.cache_clear()
+        
+        settings1 = get_settings(max_tokens=1000, extra_headers=['x'])
+        settings2 = get_settings(max_tokens=1000, extra_headers=['x'])
+        
+        assert settings1.max_tokens == 1000
+        assert settings1 is not settings2
+    
     def test_get_settings_cache_can_be_cleared(self, clean_env):
         """Test that get_settings cache can be cleared."""
         
@@ -116,6 +116,21 @@ class TestCustomizationResult:
         assert freq["Python"] == 3
         assert freq["AWS"] == 1
     
+    def test_keyword_frequency_follows_content_edits(self):
+        """Test that frequencies reflect content changed after a first analysis."""
+        result = CustomizationResult(
+            original_content="Engineer",
+            customized_content="Python engineer",
+            match_score=90.0,
+            changes=[],
+            integrated_keywords=["Python"],
+            reordered_sections=[]
+        )
+        
+        assert result.get_keyword_frequency() == {"Python": 1}
+        result.customized_content = "Python and more Python"
+        assert result.get_keyword_frequency() == {"Python": 2}
+    
     def test_diff_generation(self):
         """Test diff generation between original and customized content."""
         result = CustomizationResult(
@@ -136,6 +151,28 @@ class TestCustomizationResult:
         assert diff[3] == DiffLine(type=DiffType.UNCHANGED, content="Line 3", line_num=3)
         assert diff[4] == DiffLine(type=DiffType.ADDED, content="Line 4", line_num=4)
     
+    def test_diff_generation_replaced_block(self):
+        """Test that a replaced block lists removed lines before added lines."""
+        result = CustomizationResult(
+            original_content="Header\nOld A\nOld B\nFooter",
+            customized_content="Header\nNew A\nNew B\nFooter",
+            match_score=80.0,
+            changes=[],
+            integrated_keywords=[],
+            reordered_sections=[]
+        )
+        
+        diff = result.generate_diff()
+        
+        assert [(line.type, line.content, line.line_num) for line in diff] == [
+            (DiffType.UNCHANGED, "Header", 1),
+            (DiffType.REMOVED, "Old A", 2),
+            (DiffType.REMOVED, "Old B", 3),
+            (DiffType.ADDED, "New A", 2),
+            (DiffType.ADDED, "New B", 3),
+            (DiffType.UNCHANGED, "Footer", 4),
+        ]
+    
     def test_cli_format_output(self, sample_result):
         """Test CLI-friendly formatted output."""
         output = sample_result.format_for_cli()
@@ -272,4 +309,20 @@ class TestCustomizationResult:
         assert metrics["original_length"] == 25
         assert metrics["customized_length"] == 63
         assert metrics["length_increase_percent"] > 100
-        assert metrics["keyword_density_change"] > 0
\ No newline at end of file
+        assert metrics["keyword_density_change"] > 0
+    
+    def test_comparison_metrics_unchanged_content(self):
+        """Test that identical content yields zero change metrics."""
+        result = CustomizationResult(
+            original_content="Python resume content",
+            customized_content="Python resume content",
+            match_score=50.0,
+            changes=[],
+            integrated_keywords=["python"],
+            reordered_sections=[]
+        )
+        
+        metrics = result.get_comparison_metrics()
+        
+        assert metrics["length_increase_percent"] == 0
+        assert metrics["keyword_density_change"] == 0
\ No newline at end of file
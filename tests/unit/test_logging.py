@@ -168,6 +168,19 @@ class TestLogging:
                 del os.environ['RESUME_LOG_FORMAT']
             pytest.skip("JSON formatting not implemented yet")
     
+    def test_json_formatter_uses_record_creation_time(self):
+        """Test that JSON timestamps come from the record, in UTC."""
+        from resume_customizer.utils.logging import JSONFormatter
+        
+        record = logging.LogRecord(
+            'resume_customizer', logging.INFO, __file__, 1, "Created", None, None
+        )
+        record.created = 1704110400.25  # 2024-01-01 12:00:00.25 UTC
+        
+        log_data = json.loads(JSONFormatter().format(record))
+        
+        assert log_data['timestamp'] == '2024-01-01T12:00:00.250000'
+    
     def test_context_data_support(self, clean_logging, caplog):
         """Test that logger supports context data (job_id, resume_name)."""
         from resume_customizer.utils.logging import get_logger
@@ -4,6 +4,7 @@
 import pytest
 from pathlib import Path
 import tempfile
+import io
 import os
 from unittest.mock import patch, mock_open
 
@@ -99,6 +100,21 @@ Experienced software engineer with 10+ years of experience.
         result = reader.read(str(test_file))
         assert "你好" in result
     
+    def test_detect_utf16_be_encoding(self, reader, tmp_path):
+        """Test that a big-endian UTF-16 BOM selects the matching codec."""
+        content = "# Resume\n\nUnicode content: 你好"
+        test_file = tmp_path / "utf16_be_resume.md"
+        test_file.write_bytes(b'\xfe\xff' + content.encode('utf-16-be'))
+        
+        assert reader.read(str(test_file)) == content
+    
+    def test_read_from_binary_stream(self, reader):
+        """Test reading from an in-memory binary stream instead of a path."""
+        content = "# Resume\n\nSpecial chars: café"
+        
+        assert reader.read(io.BytesIO(content.encode('utf-8'))) == content
+        assert reader.read(io.BytesIO(b'\xff\xfe' + content.encode('utf-16-le'))) == content
+    
     def test_invalid_encoding_fallback(self, reader, tmp_path):
         """Test fallback behavior for files with invalid encoding."""
         # Create a file with mixed/invalid encoding - using latin-1 with special chars
@@ -173,6 +189,12 @@ Blank lines above and below
         
         assert metadata == {}
     
+    def test_extract_metadata_unterminated_frontmatter(self, reader):
+        """Test that front matter without a closing fence is ignored."""
+        content = "---\nname: John Doe\n\n# Resume\n" + "Content\n" * 20000
+        
+        assert reader.extract_metadata(content) == {}
+    
     def test_handle_empty_file(self, reader, tmp_path):
         """Test handling of empty markdown file."""
         empty_file = tmp_path / "empty.md"
@@ -196,6 +218,35 @@ Blank lines above and below
         assert len(result) > 1_000_000
         assert result.startswith("# Resume")
     
+    def test_detect_encoding_beyond_sample(self, reader, tmp_path):
+        """Test that non-ASCII text after the detection sample still decodes."""
+        content = "# Resume\n\n" + "Plain ascii text. " * 1000 + "\nSpecial: café, naïve"
+        test_file = tmp_path / "late_unicode.md"
+        test_file.write_text(content, encoding='utf-8')
+        
+        result = reader.read(str(test_file))
+        assert result == content
+    
+    def test_repeated_read_uses_cache(self, reader, tmp_path):
+        """Test that re-reading an unchanged file is served from the cache."""
+        test_file = tmp_path / "cached.md"
+        test_file.write_text("# Resume\n\nOriginal", encoding='utf-8')
+        
+        assert reader.read(str(test_file)) == "# Resume\n\nOriginal"
+        assert reader.read(str(test_file)) == "# Resume\n\nOriginal"
+        assert reader.cache_info()['read'].hits == 1
+        
+        # Changing the file invalidates the cached entry
+        test_file.write_text("# Resume\n\nUpdated content", encoding='utf-8')
+        assert reader.read(str(test_file)) == "# Resume\n\nUpdated content"
+    
+    def test_cached_metadata_is_not_shared(self, reader, sample_markdown_content):
+        """Test that mutating returned metadata does not affect later calls."""
+        metadata = reader.extract_metadata(sample_markdown_content)
+        metadata['name'] = 'Someone Else'
+        
+        assert reader.extract_metadata(sample_markdown_content)['name'] == 'John Doe'
+    
     def test_handle_windows_line_endings(self, reader, tmp_path):
         """Test handling of Windows (CRLF) line endings."""
         content_with_crlf = "# Resume\r\n\r\n## Section\r\nContent"
@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import os
+import threading
 import time
 from datetime import datetime
 from unittest.mock import patch, Mock
@@ -123,6 +124,49 @@ End of content"""
         # Verify new content was written
         assert output_file.read_text() == sample_content
     
+    def test_atomic_overwrite_backup_keeps_original(self, writer, tmp_path, sample_content):
+        """Test that the backup taken before an atomic write keeps the old data."""
+        output_file = tmp_path / "resume.md"
+        original_content = "# Original Resume\n\nOld content"
+        output_file.write_text(original_content)
+        
+        assert writer.write(sample_content, str(output_file), atomic=True) is True
+        
+        backup_files = list(tmp_path.glob("resume.md.backup.*"))
+        assert len(backup_files) == 1
+        assert backup_files[0].read_text() == original_content
+        assert output_file.read_text() == sample_content
+    
+    def test_failed_atomic_write_keeps_backup_intact(self, writer, tmp_path, sample_content):
+        """Test that a failed atomic write can't leave a backup sharing the file's data."""
+        output_file = tmp_path / "resume.md"
+        original_content = "# Original Resume\n\nOld content"
+        output_file.write_text(original_content)
+        
+        with patch('os.replace', side_effect=OSError("replace failed")):
+            assert writer.write(sample_content, str(output_file), atomic=True) is False
+        assert output_file.read_text() == original_content
+        
+        # A later in-place write must not change any existing backup
+        assert writer.write("# Direct write", str(output_file)) is True
+        
+        backup_files = list(tmp_path.glob("resume.md.backup.*"))
+        assert len(backup_files) == 1
+        assert backup_files[0].read_text() == original_content
+        assert output_file.read_text() == "# Direct write"
+    
+    def test_skip_unchanged_content(self, writer, tmp_path, sample_content):
+        """Test that rewriting identical content leaves the file untouched."""
+        output_file = tmp_path / "resume.md"
+        assert writer.write(sample_content, str(output_file)) is True
+        mtime = output_file.stat().st_mtime_ns
+        
+        assert writer.write(sample_content, str(output_file)) is True
+        
+        # No backup and no rewrite for a no-op update
+        assert list(tmp_path.glob("resume.md.backup.*")) == []
+        assert output_file.stat().st_mtime_ns == mtime
+    
     def test_no_backup_for_new_file(self, writer, tmp_path, sample_content):
         """Test that no backup is created for new files."""
         output_file = tmp_path / "new_resume.md"
@@ -200,17 +244,44 @@ End of content"""
         """Test atomic write operation (write to temp, then rename)."""
         output_file = tmp_path / "atomic.md"
         
-        # Mock to verify temp file is used
-        with patch('tempfile.NamedTemporaryFile') as mock_temp:
-            mock_file = Mock()
-            mock_temp.return_value.__enter__.return_value = mock_file
-            mock_file.name = str(tmp_path / "temp_file")
+        # Spy on the rename to verify a temp file is used
+        with patch('os.replace', wraps=os.replace) as mock_replace:
+            success = writer.write(sample_content, str(output_file), atomic=True)
             
-            writer.write(sample_content, str(output_file), atomic=True)
+            # Verify temp file was renamed over the target
+            assert success is True
+            mock_replace.assert_called_once()
+            tmp_name = Path(mock_replace.call_args[0][0]).name
+            assert tmp_name == f"atomic.md.tmp.{os.getpid()}.{threading.get_ident()}"
+        
+        assert output_file.read_text(encoding='utf-8') == sample_content
+        assert list(tmp_path.iterdir()) == [output_file]
+    
+    def test_atomic_writes_from_threads_use_separate_temp_files(self, writer, tmp_path):
+        """Test that threads writing the same path atomically don't share a temp file."""
+        output_file = tmp_path / "shared.md"
+        results = []
+        # Keep both threads alive until both have written so their idents differ
+        barrier = threading.Barrier(2)
+        
+        def write(content):
+            results.append(writer.write(content, str(output_file), atomic=True))
+            barrier.wait()
+        
+        with patch('os.replace', wraps=os.replace) as mock_replace:
+            threads = [
+                threading.Thread(target=write, args=(f"# Version {i}",)) for i in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
             
-            # Verify temp file was used
-            mock_temp.assert_called_once()
-            mock_file.write.assert_called()
+            tmp_names = {Path(call[0][0]).name for call in mock_replace.call_args_list}
+        
+        assert results == [True, True]
+        assert len(tmp_names) == 2
+        assert output_file.read_text() in ("# Version 0", "# Version 1")
     
     def test_success_confirmation(self, writer, tmp_path, sample_content):
         """Test success confirmation with details."""
@@ -137,6 +137,49 @@ MS Computer Science
         summary_section = next(s for s in resume.sections if s.name == "Summary")
         assert summary_section.original_name == "PROFESSIONAL SUMMARY"
     
+    def test_normalizes_headers_containing_known_names(self):
+        """Test that longer headers normalize by the known name they contain."""
+        
+        markdown = """# John Doe
+
+## Professional Work Experience 2010-2020
+Worked at various companies.
+
+## Skills & Tools
+Python, Java, C++
+
+## Side Projects
+A compiler.
+"""
+        
+        resume = Resume.from_markdown(markdown)
+        section_names = [s.name for s in resume.sections]
+        
+        assert section_names == ["Experience", "Skills", "Side Projects"]
+        assert resume.skills == ["Python", "Java", "C++"]
+    
+    def test_exact_section_header_preferred_over_contained_name(self):
+        """Test that a header containing a known name doesn't shadow an exact one."""
+        
+        markdown = """# John Doe
+
+## Volunteer Experience
+Food bank 1990 - 1992
+
+## Work Experience
+Engineer at Acme 2015 - 2020
+"""
+        
+        resume = Resume.from_markdown(markdown)
+        
+        assert [s.name for s in resume.sections] == ["Experience", "Experience"]
+        assert resume.get_section("Experience").original_name == "Work Experience"
+        assert resume.years_of_experience == datetime.now().year - 2015
+        
+        # Without an exact header, the contained name still matches
+        volunteer_only = Resume.from_markdown("# Jane Doe\n\n## Volunteer Experience\nFood bank\n")
+        assert volunteer_only.get_section("Experience").original_name == "Volunteer Experience"
+    
     def test_extract_contact_info(self):
         """Test extraction of contact information."""
         
@@ -154,6 +197,10 @@ Phone: 555.123.4567
             # Format 2: Mixed format
             """# John Doe
 Contact: john@email.com • 555-123-4567
+""",
+            # Format 4: Pipe without surrounding spaces
+            """# John Doe
+john@email.com|555-123-4567
 """
         ]
         